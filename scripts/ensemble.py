@@ -145,6 +145,7 @@ Usage:
 
 import argparse
 import hashlib
+import heapq
 import os
 import sys
 import re
@@ -1352,7 +1353,7 @@ def get_highest_priority_question() -> dict | None:
     if not pending:
         return None
     
-    # Sort by kind priority (higher index = higher priority)
+    # Pick by kind priority (higher index = higher priority)
     def priority_key(q):
         kind = q.get('kind', '')
         try:
@@ -1360,8 +1361,7 @@ def get_highest_priority_question() -> dict | None:
         except ValueError:
             return -1
     
-    pending.sort(key=priority_key, reverse=True)
-    return pending[0]
+    return max(pending, key=priority_key)
 
 
 def log_question_event(event_type: str, details: dict = None):
@@ -1597,6 +1597,11 @@ def is_lock_expired(lock_info: dict, ttl_minutes: int = None) -> bool:
         ttl_minutes = lock_info.get('ttl_minutes', 30)
     
     try:
+        # Newer locks carry an epoch stamp; compare it directly instead of re-parsing
+        acquired_epoch = lock_info.get('acquired_at_utc')
+        if isinstance(acquired_epoch, (int, float)):
+            return (time.time() - acquired_epoch) / 60 > ttl_minutes
+        
         acquired_utc = parse_timestamp_to_utc(lock_info['acquired_at'])
         if acquired_utc == 0.0:
             return True  # Invalid timestamp
@@ -1630,6 +1635,7 @@ def acquire_lock(agent: str, file_path: str, task_id: str, ttl_minutes: int = 30
         'agent': agent,
         'task_id': task_id,
         'acquired_at': get_kst_now(),
+        'acquired_at_utc': time.time(),
         'ttl_minutes': ttl_minutes
     }
     data['locks'] = locks
@@ -2071,7 +2077,7 @@ def generate_findings(task_id: str = None) -> str:
 | File | Open | Resolved | Total |
 |------|------|----------|-------|
 """
-    for f, errs in sorted(errors_by_file.items(), key=lambda x: -len(x[1]))[:10]:
+    for f, errs in heapq.nlargest(10, errors_by_file.items(), key=lambda x: len(x[1])):
         open_count = len([e for e in errs if e.get('status') == 'OPEN'])
         resolved_count = len([e for e in errs if e.get('status') == 'RESOLVED'])
         content += f"| `{f[:40]}` | {open_count} | {resolved_count} | {len(errs)} |\n"
@@ -3537,9 +3543,11 @@ def cmd_lock(args):
 
 
 def cmd_conflicts(args):
-    """Check for conflicts in PAR mode."""
-    ensure_dirs()
+    """Check for conflicts in PAR mode.
     
+    Read-only: only the focus file and _locks.json are read, and no task
+    directories are created.
+    """
     focus = get_full_focus()
     parallel_tasks = focus.get('parallel_tasks', {})
     
@@ -4020,7 +4028,7 @@ def cmd_metrics(args):
         by_kind = metrics.get('by_kind', {})
         if by_kind:
             print("│  📋 By Kind:")
-            for kind, count in sorted(by_kind.items(), key=lambda x: -x[1])[:5]:
+            for kind, count in heapq.nlargest(5, by_kind.items(), key=lambda x: x[1]):
                 print(f"│     • {kind}: {count}")
         
         matlab_runs = metrics.get('matlab_runs', 0)
@@ -5238,9 +5246,13 @@ def cmd_report(args):
     
     # Generate report ID
     today = datetime.now().strftime("%Y-%m-%d")
-    existing = list(report_dir.glob(f"REPORT-{today}-*.md"))
-    num = len(existing) + 1
-    report_id = f"REPORT-{today}-{num:03d}"
+    max_num = 0
+    for existing in report_dir.glob(f"REPORT-{today}-*.md"):
+        try:
+            max_num = max(max_num, int(existing.stem.rsplit("-", 1)[-1]))
+        except ValueError:
+            continue
+    report_id = f"REPORT-{today}-{max_num + 1:03d}"
     
     # Template based on type
     templates = {
@@ -5383,31 +5395,11 @@ id: {report_id}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-# MAIN
+# CLI PARSER
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def main():
-    global WORKSPACE
-    
-    parser = argparse.ArgumentParser(
-        description="Ensemble CLI Tool v4.2.0 (vibe-kit inspired)",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    
-    parser.add_argument("--version", "-v", action="version", version="Ensemble CLI v4.2.0")
-    parser.add_argument(
-        "--forward",
-        action="store_true",
-        help="Use the additive forward `.conitens` runtime surface for selected read-only commands.",
-    )
-    
-    parser.add_argument("--workspace", "-w",
-        help="Workspace directory",
-        default=os.environ.get("ENSEMBLE_WORKSPACE", os.getcwd()))
-    
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-    
-    # new
+# new
+def _add_new_parser(subparsers):
     p_new = subparsers.add_parser("new", help="Create new task")
     p_new.add_argument("--mode", choices=MODES, default="GCC")
     p_new.add_argument("--case", choices=CASE_NAMES + ["1", "2", "3", "4"], default="NEW_BUILD",
@@ -5419,8 +5411,10 @@ def main():
     p_new.add_argument("--agent", help="agent for SOLO mode")
     p_new.add_argument("--force", "-f", action="store_true", help="Skip duplicate check")
     p_new.add_argument("--related", help="Related task ID for feedback/follow-up (v4.0)")
-    
-    # start
+
+
+# start
+def _add_start_parser(subparsers):
     p_start = subparsers.add_parser("start", help="Start task")
     p_start.add_argument("--task", help="Task ID")
     p_start.add_argument("--agent", default="CLI")
@@ -5428,8 +5422,10 @@ def main():
                         help="Enable vibe-kit for this task (default: on for GCC mode)")
     p_start.add_argument("--no-vibe", action="store_true", dest="no_vibe",
                         help="Disable vibe-kit for this task")
-    
-    # log
+
+
+# log
+def _add_log_parser(subparsers):
     p_log = subparsers.add_parser("log", help="Record STEP LOG + Journal")
     p_log.add_argument("--done", required=True)
     p_log.add_argument("--change", required=True)
@@ -5439,65 +5435,83 @@ def main():
     p_log.add_argument("--phase")
     p_log.add_argument("--summary")
     p_log.add_argument("--feedback", help="User feedback to log (v4.0)")
-    
-    # close
+
+
+# close
+def _add_close_parser(subparsers):
     p_close = subparsers.add_parser("close", help="Close task (DONE)")
     p_close.add_argument("--task")
     p_close.add_argument("--agent", default="CLI")
     p_close.add_argument("--summary")
     p_close.add_argument("--skip-verify", action="store_true", help="Skip verification gate (not recommended)")
-    
-    # verify (v4.2) - mandatory before close
+
+
+# verify (v4.2) - mandatory before close
+def _add_verify_parser(subparsers):
     p_verify = subparsers.add_parser("verify", help="Verify code (syntax, import, smoke test)")
     p_verify.add_argument("--task", help="Task ID")
     p_verify.add_argument("--files", help="Comma-separated file paths to verify")
     p_verify.add_argument("--agent", default="CLI")
     p_verify.add_argument("--skip-smoke", action="store_true", help="Skip smoke test")
     p_verify.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
-    
-    # reopen (v4.2)
+
+
+# reopen (v4.2)
+def _add_reopen_parser(subparsers):
     p_reopen = subparsers.add_parser("reopen", help="Reopen COMPLETED task (error report)")
     p_reopen.add_argument("--task", required=True, help="TASK-COMPLETED-... ID")
     p_reopen.add_argument("--reason", required=True, help="Error description or reopen reason")
     p_reopen.add_argument("--error-id", help="Related Error ID (ERR-YYYYMMDD-NNN)")
     p_reopen.add_argument("--agent", default="CLI")
     p_reopen.add_argument("--force", "-f", action="store_true", help="Force switch if another task is ACTIVE")
-    
-    # halt
+
+
+# halt
+def _add_halt_parser(subparsers):
     p_halt = subparsers.add_parser("halt", help="Halt task")
     p_halt.add_argument("--task")
     p_halt.add_argument("--reason", choices=HALT_REASONS, required=True)
     p_halt.add_argument("--desc", required=True, help="Description")
     p_halt.add_argument("--resume", required=True, help="Resume condition")
     p_halt.add_argument("--agent", default="CLI")
-    
-    # dump
+
+
+# dump
+def _add_dump_parser(subparsers):
     p_dump = subparsers.add_parser("dump", help="Dump task")
     p_dump.add_argument("--task")
     p_dump.add_argument("--reason", choices=DUMP_REASONS, required=True)
     p_dump.add_argument("--desc", required=True, help="Description")
     p_dump.add_argument("--lesson", required=True, help="Lessons learned")
     p_dump.add_argument("--agent", default="CLI")
-    
-    # status
+
+
+# status
+def _add_status_parser(subparsers):
     p_status = subparsers.add_parser("status", help="Show status")
     p_status.add_argument("--halted", action="store_true")
     p_status.add_argument("--dumped", action="store_true")
     p_status.add_argument("--locks", action="store_true", help="Show file locks")
     p_status.add_argument("--errors", action="store_true", help="Show error summary")
     p_status.add_argument("--questions", action="store_true", help="Show pending questions (v3.7)")
-    
-    # lock (v3.5)
+
+
+# lock (v3.5)
+def _add_lock_parser(subparsers):
     p_lock = subparsers.add_parser("lock", help="Manage file locks")
     p_lock.add_argument("action", choices=["list", "acquire", "release", "cleanup", "release-all"],
                         help="Lock action")
     p_lock.add_argument("--file", "-f", help="File path to lock/release")
     p_lock.add_argument("--agent", default="CLI", help="Agent name")
-    
-    # conflicts (v3.5)
+
+
+# conflicts (v3.5)
+def _add_conflicts_parser(subparsers):
     p_conflicts = subparsers.add_parser("conflicts", help="Check for PAR mode conflicts")
-    
-    # error (v3.6)
+
+
+# error (v3.6)
+def _add_error_parser(subparsers):
     p_error = subparsers.add_parser("error", help="Manage error registry (v3.6)")
     p_error.add_argument("action", choices=["register", "search", "resolve", "list", "findings"],
                          help="Error action")
@@ -5510,48 +5524,63 @@ def main():
     p_error.add_argument("--status", choices=["OPEN", "RESOLVED"], help="Filter by status")
     p_error.add_argument("--task", help="Filter by related task")
     p_error.add_argument("--agent", default="CLI", help="Agent name")
-    
-    # sync (v3.6)
+
+
+# sync (v3.6)
+def _add_sync_parser(subparsers):
     p_sync = subparsers.add_parser("sync", help="Execute PAR mode sync point (v3.6)")
     p_sync.add_argument("--force", action="store_true", help="Force sync even without PAR mode")
     p_sync.add_argument("--agent", default="CLI", help="Agent name")
-    
-    # approve (v3.7, extended in v3.8)
+
+
+# approve (v3.7, extended in v3.8)
+def _add_approve_parser(subparsers):
     p_approve = subparsers.add_parser("approve", help="Approve pending question for execution (v3.7)")
     p_approve.add_argument("--question", "-q", help="Question ID to approve")
     p_approve.add_argument("--latest", action="store_true", help="Approve highest priority pending question")
     p_approve.add_argument("--dry-run", action="store_true", help="Validate without executing")
     p_approve.add_argument("--kind", "-k", choices=QUESTION_KINDS, help="Filter by question kind (v3.8)")
-    
-    # init-owner (v3.7)
+
+
+# init-owner (v3.7)
+def _add_init_owner_parser(subparsers):
     p_init_owner = subparsers.add_parser("init-owner", help="Initialize project ownership (v3.7)")
     p_init_owner.add_argument("--force", action="store_true", help="Force reinitialize even if exists")
-    
-    # questions (v3.8)
+
+
+# questions (v3.8)
+def _add_questions_parser(subparsers):
     p_questions = subparsers.add_parser("questions", help="Manage question queue (v3.8)")
     p_questions.add_argument("action", choices=["list", "prune", "snapshot"],
                               help="Question queue action")
     p_questions.add_argument("--stale-hours", type=int, default=24, help="Hours before marking stale (default: 24)")
     p_questions.add_argument("--force", action="store_true", help="Force prune without confirmation")
-    
-    # metrics (v3.8)
+
+
+# metrics (v3.8)
+def _add_metrics_parser(subparsers):
     p_metrics = subparsers.add_parser("metrics", help="View/manage metrics (v3.8)")
     p_metrics.add_argument("action", choices=["show", "reset", "export"],
                            help="Metrics action")
     p_metrics.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
-    
-    # ═══════════════════════════════════════════════════════════════════════════════
-    # v3.9 NEW COMMANDS
-    # ═══════════════════════════════════════════════════════════════════════════════
-    
-    # triage (v3.9)
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# v3.9 NEW COMMANDS
+# ═══════════════════════════════════════════════════════════════════════════════
+
+
+# triage (v3.9)
+def _add_triage_parser(subparsers):
     p_triage = subparsers.add_parser("triage", help="Analyze run failures (v3.9)")
     p_triage.add_argument("--task", "-t", help="Task ID")
     p_triage.add_argument("--run", "-r", help="Run ID (e.g., run-001)")
     p_triage.add_argument("--verbose", "-v", action="store_true", help="Show all findings")
     p_triage.add_argument("--dry-run", action="store_true", help="Don't save results")
-    
-    # manifest (v3.9)
+
+
+# manifest (v3.9)
+def _add_manifest_parser(subparsers):
     p_manifest = subparsers.add_parser("manifest", help="Manage run manifests (v3.9)")
     p_manifest.add_argument("action", choices=["show", "create", "diff"],
                             help="Manifest action")
@@ -5562,28 +5591,38 @@ def main():
     p_manifest.add_argument("--entry", "-e", help="Entry point (for create)")
     p_manifest.add_argument("--args", "-a", help="Arguments (for create)")
     p_manifest.add_argument("--verbose", "-v", action="store_true")
-    
-    # preflight (v3.9)
+
+
+# preflight (v3.9)
+def _add_preflight_parser(subparsers):
     p_preflight = subparsers.add_parser("preflight", help="Run data contract checks (v3.9)")
     p_preflight.add_argument("--task", "-t", help="Task ID")
     p_preflight.add_argument("--init", action="store_true", help="Create preflight template")
-    
-    # impact (v3.9)
+
+
+# impact (v3.9)
+def _add_impact_parser(subparsers):
     p_impact = subparsers.add_parser("impact", help="Analyze file change impact (v3.9)")
     p_impact.add_argument("--file", "-f", help="File to analyze")
     p_impact.add_argument("--hotspots", action="store_true", help="Show file hotspots")
     p_impact.add_argument("--days", "-d", type=int, default=7, help="Days for hotspot analysis")
-    
-    # weekly (v3.9)
+
+
+# weekly (v3.9)
+def _add_weekly_parser(subparsers):
     p_weekly = subparsers.add_parser("weekly", help="Generate weekly self-improvement report (v3.9)")
     p_weekly.add_argument("--dry-run", action="store_true", help="Preview without saving")
-    
-    # context (v3.9)
+
+
+# context (v3.9)
+def _add_context_parser(subparsers):
     p_context = subparsers.add_parser("context", help="Manage LATEST_CONTEXT.md (v3.9)")
     p_context.add_argument("action", choices=["update", "show"],
                            help="Context action")
 
-    # workflow extensions
+
+# workflow extensions
+def _add_workflow_parser(subparsers):
     p_workflow = subparsers.add_parser("workflow", help="Run workflow contracts")
     p_workflow.add_argument("action", choices=["run", "resume", "show", "explain"], help="Workflow action")
     p_workflow.add_argument("--workflow", help="Workflow path or slug")
@@ -5592,7 +5631,9 @@ def main():
     p_workflow.add_argument("--set", action="append", default=[], help="Workflow input key=value")
     p_workflow.add_argument("--dry-run", action="store_true", help="Validate and render steps without executing")
 
-    # meeting recorder
+
+# meeting recorder
+def _add_meet_parser(subparsers):
     p_meet = subparsers.add_parser("meet", help="Record append-only meetings")
     p_meet.add_argument("action", choices=["start", "say", "end", "show", "list"], help="Meeting action")
     p_meet.add_argument("--meeting", help="Meeting ID")
@@ -5606,17 +5647,23 @@ def main():
     p_meet.add_argument("--actor", default="CLI")
     p_meet.add_argument("--summary-mode", default="decisions", choices=["decisions", "action_items", "timeline"])
 
-    # hooks
+
+# hooks
+def _add_hooks_parser(subparsers):
     p_hooks = subparsers.add_parser("hooks", help="Install or run local git hooks")
     p_hooks.add_argument("action", choices=["install", "pre-commit", "post-commit", "commit-msg"], help="Hook action")
     p_hooks.add_argument("--configure-git", action="store_true")
     p_hooks.add_argument("message_file", nargs="?")
 
-    # office report
+
+# office report
+def _add_office_parser(subparsers):
     p_office = subparsers.add_parser("office", help="Generate static office report")
     p_office.add_argument("--format", choices=["md", "html"], default="md")
 
-    # mcp server
+
+# mcp server
+def _add_mcp_parser(subparsers):
     p_mcp = subparsers.add_parser("mcp", help="Read-only MCP helper/server")
     p_mcp.add_argument("action", choices=["serve", "tools", "call", "resources", "resource-read", "prompts", "prompt-get"], help="MCP action")
     p_mcp.add_argument("--tool", help="Tool name")
@@ -5624,14 +5671,18 @@ def main():
     p_mcp.add_argument("--prompt", help="Prompt name")
     p_mcp.add_argument("--arguments", help="JSON string for tool arguments")
 
-    # telegram skeleton
+
+# telegram skeleton
+def _add_telegram_parser(subparsers):
     p_telegram = subparsers.add_parser("telegram", help="Telegram bridge skeleton")
     p_telegram.add_argument("action", choices=["status", "notify", "approval-request", "mirror-meeting"], help="Telegram action")
     p_telegram.add_argument("--text", help="Notification text")
     p_telegram.add_argument("--meeting", help="Meeting ID")
     p_telegram.add_argument("--actor", default="CLI")
 
-    # provider-backed subagents
+
+# provider-backed subagents
+def _add_spawn_parser(subparsers):
     p_spawn = subparsers.add_parser("spawn", help="Spawn provider-backed subagents")
     p_spawn.add_argument(
         "action",
@@ -5647,7 +5698,9 @@ def main():
     p_spawn.add_argument("--spawn", help="Spawn ID")
     p_spawn.add_argument("--actor", default="CLI")
 
-    # persistent memory
+
+# persistent memory
+def _add_memory_parser(subparsers):
     p_memory = subparsers.add_parser("memory", help="Manage agent persona and long-term memory")
     p_memory.add_argument("action", choices=["init-agent", "append", "show"], help="Memory action")
     p_memory.add_argument("--kind", choices=["persona", "longterm", "shared"], default="longterm")
@@ -5658,7 +5711,9 @@ def main():
     p_memory.add_argument("--tags", help="Comma-separated tags")
     p_memory.add_argument("--task", help="Related task ID")
 
-    # project rooms
+
+# project rooms
+def _add_room_parser(subparsers):
     p_room = subparsers.add_parser("room", help="Manage project chat rooms")
     p_room.add_argument("action", choices=["create", "post", "show", "export"], help="Room action")
     p_room.add_argument("--name", help="Room name")
@@ -5671,7 +5726,9 @@ def main():
     p_room.add_argument("--task", help="Related task ID")
     p_room.add_argument("--actor", default="CLI")
 
-    # runtime UI
+
+# runtime UI
+def _add_ui_parser(subparsers):
     p_ui = subparsers.add_parser("ui", help="Launch terminal or web UI")
     p_ui.add_argument("action", choices=["tui", "web"], help="UI action")
     p_ui.add_argument("--interval", type=float, default=2.0, help="Refresh interval for TUI")
@@ -5679,7 +5736,9 @@ def main():
     p_ui.add_argument("--host", default="127.0.0.1")
     p_ui.add_argument("--port", type=int, default=8765)
 
-    # additive forward runtime entry contract
+
+# additive forward runtime entry contract
+def _add_forward_parser(subparsers):
     p_forward = subparsers.add_parser(
         "forward",
         help="Quarantined forward `.conitens` sidecar entry surface",
@@ -5728,6 +5787,8 @@ def main():
     p_forward.add_argument("--limit", type=int, help="Optional row limit for bounded forward projections")
     p_forward.add_argument("--repository", help="Optional repository override for PR/CI evidence import")
 
+
+def _add_episode_parser(subparsers):
     p_episode = subparsers.add_parser("episode", help="Manage episode closure attempts")
     p_episode.add_argument("action", choices=["close"], help="Episode action")
     p_episode.add_argument("episode_id", help="Existing episode id")
@@ -5745,6 +5806,8 @@ def main():
     p_episode.add_argument("--next-reason")
     p_episode.add_argument("--comparison-key")
 
+
+def _add_improvement_parser(subparsers):
     p_improvement = subparsers.add_parser("improvement", help="Read public agent-improvement artifacts")
     p_improvement.add_argument(
         "action",
@@ -5781,23 +5844,176 @@ def main():
     p_improvement.add_argument("--observed-closure")
     p_improvement.add_argument("--revision-id")
 
-    # v4.2 Upgrade System
+
+# v4.2 Upgrade System
+def _add_upgrade_scan_parser(subparsers):
     p_upgrade_scan = subparsers.add_parser("upgrade-scan", help="Scan journals for upgrade candidates (v4.2)")
     p_upgrade_scan.add_argument("--since", "-s", help="Scan from date (YYYY-MM-DD)")
     p_upgrade_scan.add_argument("--verbose", "-v", action="store_true", help="Show full report")
-    
+
+
+def _add_upgrade_setup_parser(subparsers):
     p_upgrade_setup = subparsers.add_parser("upgrade-setup", help="Prepare version upgrade - owner only (v4.2)")
     p_upgrade_setup.add_argument("--version", "-V", required=True, help="New version (e.g., 4.3.0)")
     p_upgrade_setup.add_argument("--changelog", "-c", help="Changelog title")
     p_upgrade_setup.add_argument("--dry-run", action="store_true", help="Preview without changes")
-    
+
+
+def _add_upgrade_parser(subparsers):
     p_upgrade = subparsers.add_parser("upgrade", help="Execute version upgrade - owner only (v4.2)")
     p_upgrade.add_argument("--push", action="store_true", help="Push to origin after commit")
     p_upgrade.add_argument("--dry-run", action="store_true", help="Preview without changes")
-    
+
+
+def _add_report_parser(subparsers):
     p_report = subparsers.add_parser("report", help="Generate structured GitHub issue report (v4.2)")
     p_report.add_argument("--type", "-t", choices=["bug", "suggestion", "feedback"], 
                           default="feedback", help="Report type")
+
+
+# Subcommand parser builders, in the order help lists them
+COMMAND_PARSERS = {
+    "new": _add_new_parser,
+    "start": _add_start_parser,
+    "log": _add_log_parser,
+    "close": _add_close_parser,
+    "verify": _add_verify_parser,
+    "reopen": _add_reopen_parser,
+    "halt": _add_halt_parser,
+    "dump": _add_dump_parser,
+    "status": _add_status_parser,
+    "lock": _add_lock_parser,
+    "conflicts": _add_conflicts_parser,
+    "error": _add_error_parser,
+    "sync": _add_sync_parser,
+    "approve": _add_approve_parser,
+    "init-owner": _add_init_owner_parser,
+    "questions": _add_questions_parser,
+    "metrics": _add_metrics_parser,
+    "triage": _add_triage_parser,
+    "manifest": _add_manifest_parser,
+    "preflight": _add_preflight_parser,
+    "impact": _add_impact_parser,
+    "weekly": _add_weekly_parser,
+    "context": _add_context_parser,
+    "workflow": _add_workflow_parser,
+    "meet": _add_meet_parser,
+    "hooks": _add_hooks_parser,
+    "office": _add_office_parser,
+    "mcp": _add_mcp_parser,
+    "telegram": _add_telegram_parser,
+    "spawn": _add_spawn_parser,
+    "memory": _add_memory_parser,
+    "room": _add_room_parser,
+    "ui": _add_ui_parser,
+    "forward": _add_forward_parser,
+    "episode": _add_episode_parser,
+    "improvement": _add_improvement_parser,
+    "upgrade-scan": _add_upgrade_scan_parser,
+    "upgrade-setup": _add_upgrade_setup_parser,
+    "upgrade": _add_upgrade_parser,
+    "report": _add_report_parser,
+}
+
+
+def _build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+    
+    When command names a known subcommand only its parser is added; otherwise
+    (help, typos, a bare invocation) every subcommand is, so usage lists them
+    all. The --version fast path adds none.
+    """
+    parser = _CommandParser(
+        description="Ensemble CLI Tool v4.2.0 (vibe-kit inspired)",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    
+    parser.add_argument("--version", "-v", action="version", version="Ensemble CLI v4.2.0")
+    parser.add_argument(
+        "--forward",
+        action="store_true",
+        help="Use the additive forward `.conitens` runtime surface for selected read-only commands.",
+    )
+    
+    parser.add_argument("--workspace", "-w",
+        help="Workspace directory",
+        default=os.environ.get("ENSEMBLE_WORKSPACE", os.getcwd()))
+    
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    
+    if command in COMMAND_PARSERS:
+        COMMAND_PARSERS[command](subparsers)
+        parser.partial = True
+    elif command == "--version":
+        parser.partial = True
+    else:
+        for build in COMMAND_PARSERS.values():
+            build(subparsers)
+    return parser
+
+
+class _FullParseRequired(Exception):
+    """Raised when a partially built parser hits an error mid-parse."""
+
+
+class _CommandParser(argparse.ArgumentParser):
+    """Top-level parser; a partially built one reports errors through the full tree.
+    
+    A parse error re-parses the same arguments with every subcommand added, so
+    the message (e.g. the invalid-choice list) matches the full parser's.
+    """
+    
+    partial = False
+    _parsing = False
+    
+    def parse_args(self, args=None, namespace=None):
+        if not self.partial:
+            return super().parse_args(args, namespace)
+        self._parsing = True
+        try:
+            return super().parse_args(args, namespace)
+        except _FullParseRequired:
+            return _build_parser().parse_args(args, namespace)
+        finally:
+            self._parsing = False
+    
+    def error(self, message):
+        if self.partial:
+            if self._parsing:
+                raise _FullParseRequired(message)
+            _build_parser().error(message)
+        super().error(message)
+
+
+def _command_token(argv: list) -> str | None:
+    """Return the subcommand named in argv, skipping global options.
+    
+    Returns "--version" when the version flag comes before any command, and
+    None when help is requested or no command is given.
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in ("-h", "--help"):
+            return None
+        elif arg in ("-v", "--version"):
+            return "--version"
+        elif arg == "-w" or (len(arg) > 2 and "--workspace".startswith(arg)):
+            skip_value = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+# ═══════════════════════════════════════════════════════════════════════════════
+# MAIN
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def main():
+    global WORKSPACE
+    
+    parser = _build_parser(_command_token(sys.argv[1:]))
     
     args = parser.parse_args()
     WORKSPACE = os.path.abspath(args.workspace)
@@ -5854,8 +6070,9 @@ def main():
         "report": cmd_report,
     }
     
-    if args.command in commands:
-        commands[args.command](args)
+    handler = commands.get(args.command)
+    if handler is not None:
+        handler(args)
     else:
         parser.print_help()
     
@@ -26,6 +26,7 @@ import shutil
 import signal
 import subprocess
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -56,8 +57,23 @@ def _load_sessions() -> dict[str, Any]:
 
 
 def _save_sessions(sessions: dict[str, Any]) -> None:
-    SESSIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    SESSIONS_FILE.write_text(json.dumps(sessions, indent=2), encoding="utf-8")
+    text = json.dumps(sessions, indent=2)
+    try:
+        fd, tmp_name = tempfile.mkstemp(prefix=".bg-sessions.", suffix=".tmp", dir=str(SESSIONS_FILE.parent))
+    except FileNotFoundError:
+        # Only the first save in a fresh checkout needs the state directory
+        SESSIONS_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=".bg-sessions.", suffix=".tmp", dir=str(SESSIONS_FILE.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        os.replace(tmp_name, SESSIONS_FILE)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
 
 
 def _log_dir(workspace: str, agent: str) -> Path:
@@ -324,7 +340,8 @@ def bg_kill(workspace: str, kill_all: bool = False) -> list[dict[str, Any]]:
             killed.append({"session": name, "pid": pid})
             del sessions[name]
 
-    _save_sessions(sessions)
+    if killed:
+        _save_sessions(sessions)
     return killed
 
 
@@ -41,7 +41,7 @@ def build_artifact_path(workspace: str | Path, *, slug: str) -> Path:
     return artifacts_root(workspace) / f"claude-{slug}-{utc_timestamp_for_filename()}.md"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeAuthStatus:
     logged_in: bool
     auth_method: str | None
@@ -70,7 +70,7 @@ def probe_claude_auth() -> ClaudeAuthStatus:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaudeReviewResult:
     prompt: str
     output: str
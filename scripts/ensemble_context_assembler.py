@@ -54,7 +54,7 @@ PACKET_FIELD_SOURCES = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContextPacket:
     agent_id: str
     persona_core: dict[str, Any]
@@ -18,7 +18,7 @@ from typing import Any, Iterable
 FRONTMATTER_DELIM = "---"
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractDocument:
     path: Path
     frontmatter: dict[str, Any]
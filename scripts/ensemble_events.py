@@ -9,7 +9,7 @@ import argparse
 import json
 import os
 import re
-import uuid
+import secrets
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
@@ -123,7 +123,8 @@ def utc_iso(ts: datetime | None = None) -> str:
 
 def generate_event_id(ts: datetime | None = None) -> str:
     ts = ts or utc_now()
-    return f"E-{ts.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+    # Same 24 random bits as uuid4().hex[:6] without building a UUID per event
+    return f"E-{ts.strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
 
 
 def redact_text(text: str, rules: list[str] | None = None) -> tuple[str, list[str]]:
@@ -227,8 +228,7 @@ def external_evidence_forbidden_payload_fields(payload: dict[str, Any]) -> list[
     return _external_evidence_forbidden_payload_fields(payload)
 
 
-def append_event(
-    workspace: str | Path,
+def _build_event(
     *,
     event_type: str,
     actor: dict[str, str] | None = None,
@@ -237,7 +237,7 @@ def append_event(
     payload: dict[str, Any] | None = None,
     rules: list[str] | None = None,
     shard_by_date: bool = False,
-) -> dict[str, Any]:
+) -> tuple[dict[str, Any], str | None]:
     # Validate event_type against protocol-synced allow-list (ADR-0002)
     try:
         from ensemble_allowed_events import resolve_event_type
@@ -271,13 +271,13 @@ def append_event(
                 + ", ".join(forbidden_fields)
             )
     redacted_payload, applied_rules = redact_data(deepcopy(payload), rules)
-    shard_date = ts.strftime("%Y-%m-%d") if shard_by_date else None
-    event_path = get_events_file(workspace, shard_date=shard_date)
+    ts_utc = utc_iso(ts)
+    shard_date = ts_utc[:10] if shard_by_date else None
 
     event = {
         "event_v": EVENT_SCHEMA_V,
         "event_id": generate_event_id(ts),
-        "ts_utc": utc_iso(ts),
+        "ts_utc": ts_utc,
         "actor": actor or {"type": "system", "name": "CLI"},
         "scope": scope or {},
         "type": event_type,
@@ -288,17 +288,58 @@ def append_event(
             "rules": applied_rules,
         },
     }
+    return event, shard_date
+
 
+def _write_event_lines(workspace: str | Path, shard_date: str | None, lines: list[str]) -> None:
+    text = "".join(lines)
+    event_path = get_events_file(workspace, shard_date=shard_date)
     with event_path.open("a", encoding="utf-8") as handle:
-        handle.write(json.dumps(event, ensure_ascii=False) + "\n")
+        handle.write(text)
     legacy_event_path = get_legacy_events_file(workspace, shard_date=shard_date)
     if legacy_event_path != event_path:
         with legacy_event_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event, ensure_ascii=False) + "\n")
+            handle.write(text)
+
 
+def append_event(
+    workspace: str | Path,
+    *,
+    event_type: str,
+    actor: dict[str, str] | None = None,
+    scope: dict[str, Any] | None = None,
+    severity: str = "info",
+    payload: dict[str, Any] | None = None,
+    rules: list[str] | None = None,
+    shard_by_date: bool = False,
+) -> dict[str, Any]:
+    event, shard_date = _build_event(
+        event_type=event_type,
+        actor=actor,
+        scope=scope,
+        severity=severity,
+        payload=payload,
+        rules=rules,
+        shard_by_date=shard_by_date,
+    )
+    _write_event_lines(workspace, shard_date, [json.dumps(event, ensure_ascii=False) + "\n"])
     return event
 
 
+def append_events(workspace: str | Path, entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    # Entries are append_event keyword arguments. All events are validated before
+    # any write, and each ledger file is opened once per shard.
+    events: list[dict[str, Any]] = []
+    lines_by_shard: dict[str | None, list[str]] = {}
+    for entry in entries:
+        event, shard_date = _build_event(**entry)
+        events.append(event)
+        lines_by_shard.setdefault(shard_date, []).append(json.dumps(event, ensure_ascii=False) + "\n")
+    for shard_date, lines in lines_by_shard.items():
+        _write_event_lines(workspace, shard_date, lines)
+    return events
+
+
 def load_events(workspace: str | Path, limit: int | None = None) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
     seen_ids: set[str] = set()
@@ -21,7 +21,7 @@ from ensemble_persona_memory import CandidatePatchWriter, MemoryRepository, Pers
 from ensemble_skill_loader import resolve_persona_default_skills
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkerArtifact:
     artifact_id: str
     run_id: str
@@ -38,21 +38,21 @@ class WorkerArtifact:
     risky_action_request: dict[str, Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     passed: bool
     issues: list[dict[str, Any]]
     failure_reason: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class RetryDecision:
     retry_index: int
     decision: str
     reason: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ReflectionResult:
     repeated_failure_pattern: str | None
     good_tool_choice: list[str]
@@ -1377,23 +1377,28 @@ def append_forward_pr_ci_evidence(
     input_path: str | Path | None,
     reviewer: str | None = None,
 ) -> dict[str, Any]:
-    from ensemble_events import append_event
+    from ensemble_events import append_events
 
     workspace_root = Path(workspace)
     input_items = _read_pr_ci_evidence_input(input_path)
     normalized_items = _normalize_pr_ci_evidence_items(workspace_root, input_items)
     actor_name = (reviewer or "CLI").strip()[:120] or "CLI"
+    appended = append_events(
+        workspace_root,
+        [
+            {
+                "event_type": item["event_type"],
+                "severity": "info",
+                "actor": {"type": "operator", "name": actor_name},
+                "scope": item["scope"],
+                "payload": item["payload"],
+            }
+            for item in normalized_items
+        ],
+    )
     events = []
     redaction_rules: set[str] = set()
-    for item in normalized_items:
-        event = append_event(
-            workspace_root,
-            event_type=item["event_type"],
-            severity="info",
-            actor={"type": "operator", "name": actor_name},
-            scope=item["scope"],
-            payload=item["payload"],
-        )
+    for item, event in zip(normalized_items, appended):
         event_payload = event.get("payload") if isinstance(event.get("payload"), dict) else {}
         for rule in event.get("redaction", {}).get("rules", []):
             if isinstance(rule, str):
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -106,6 +107,17 @@ def _sort_status_confidence_rows(rows: list[dict[str, Any]]) -> list[dict[str, A
     return sorted(rows, key=sort_key)
 
 
+def _status_confidence_tallies(rows: list[dict[str, Any]]) -> tuple[Counter[str], Counter[str], Counter[str]]:
+    subject_counts: Counter[str] = Counter()
+    level_counts: Counter[str] = Counter()
+    flag_counts: Counter[str] = Counter()
+    for row in rows:
+        subject_counts[row["subject_type"]] += 1
+        level_counts[row["confidence_level"]] += 1
+        flag_counts.update(set(row.get("attention_flags", [])))
+    return subject_counts, level_counts, flag_counts
+
+
 def build_operator_status_confidence_payload(
     workspace: str | Path,
     *,
@@ -193,7 +205,8 @@ def build_operator_status_confidence_payload(
     sorted_rows = _sort_status_confidence_rows(rows)
     total_rows = len(sorted_rows)
     returned_rows = sorted_rows[:safe_limit]
-    warning_count = sum(1 for row in rows if row["confidence_level"] in {"partial", "stale"})
+    subject_counts, level_counts, flag_counts = _status_confidence_tallies(rows)
+    warning_count = level_counts["partial"] + level_counts["stale"]
     return {
         "generated_at": utc_iso(),
         "status": _status_from_counts(danger=0, warning=warning_count),
@@ -208,14 +221,14 @@ def build_operator_status_confidence_payload(
         "counts": {
             "returned": len(returned_rows),
             "total": total_rows,
-            "tasks": sum(1 for row in rows if row["subject_type"] == "task"),
-            "runs": sum(1 for row in rows if row["subject_type"] == "run"),
-            "rooms": sum(1 for row in rows if row["subject_type"] == "room"),
-            "high": sum(1 for row in rows if row["confidence_level"] == "high"),
-            "partial": sum(1 for row in rows if row["confidence_level"] == "partial"),
-            "stale": sum(1 for row in rows if row["confidence_level"] == "stale"),
-            "blocked": sum(1 for row in rows if "blocked" in row.get("attention_flags", [])),
-            "pending_approval": sum(1 for row in rows if "pending_approval" in row.get("attention_flags", [])),
+            "tasks": subject_counts["task"],
+            "runs": subject_counts["run"],
+            "rooms": subject_counts["room"],
+            "high": level_counts["high"],
+            "partial": level_counts["partial"],
+            "stale": level_counts["stale"],
+            "blocked": flag_counts["blocked"],
+            "pending_approval": flag_counts["pending_approval"],
             "truncated": total_rows > safe_limit,
         },
         "diagnostic_contract": {
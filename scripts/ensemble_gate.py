@@ -5,6 +5,7 @@ Approval-gate helpers shared by workflow and MCP extensions.
 
 from __future__ import annotations
 
+import heapq
 import json
 import uuid
 from datetime import datetime, timezone
@@ -88,7 +89,12 @@ def list_gate_records(workspace: str | Path, limit: int | None = None) -> list[d
                 continue
             seen_ids.add(gate_id)
             rows.append(row)
-    rows.sort(key=lambda item: item.get("updated_at") or item.get("created_at") or "", reverse=True)
+    def recency(item: dict[str, Any]) -> str:
+        return item.get("updated_at") or item.get("created_at") or ""
+
+    if limit is not None and limit >= 0:
+        return heapq.nlargest(limit, rows, key=recency)
+    rows.sort(key=recency, reverse=True)
     if limit is not None:
         return rows[:limit]
     return rows
@@ -6,6 +6,7 @@ Typed handoff artifacts for Conitens workflow and subagent tracking.
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
 from datetime import datetime
 from pathlib import Path
@@ -311,7 +312,12 @@ def list_handoffs(workspace: str | Path, limit: int | None = None) -> list[dict[
                 continue
             seen_ids.add(handoff_id)
             rows.append(row)
-    rows.sort(key=lambda item: item.get("updated_at") or "", reverse=True)
+    def recency(item: dict[str, Any]) -> str:
+        return item.get("updated_at") or ""
+
+    if limit is not None and limit >= 0:
+        return heapq.nlargest(limit, rows, key=recency)
+    rows.sort(key=recency, reverse=True)
     if limit is not None:
         return rows[:limit]
     return rows
@@ -5,7 +5,10 @@ SQLite-backed loop state repository for Ralph-aware execution.
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import math
+import re
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime, timezone
@@ -14,6 +17,13 @@ from typing import Any, Iterator
 
 from ensemble_loop_paths import loop_state_db_path, loop_state_debug_path
 
+ORJSON_AVAILABLE = importlib.util.find_spec("orjson") is not None
+if ORJSON_AVAILABLE:
+    import orjson
+
+# orjson reads integers beyond 64 bits as floats; stored text with digit runs
+# this long is decoded by stdlib json instead
+_LONG_DIGITS_RE = re.compile(r"[0-9]{19}")
 
 SCHEMA_VERSION = 14
 ACTIVE_RUN_STATUSES = ("active", "running")
@@ -96,13 +106,38 @@ def utc_iso(ts: datetime | None = None) -> str:
     return current.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 
+def _has_non_finite_float(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(key) or _has_non_finite_float(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
 def encode_json(value: Any) -> str:
+    # Every checkpoint/state write goes through here; orjson (optional) is used
+    # when it stores the same values as stdlib json. It raises on integers
+    # beyond 64 bits and writes NaN/Infinity as null, so those go to stdlib.
+    if ORJSON_AVAILABLE:
+        try:
+            encoded = orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            encoded = None
+        if encoded is not None and (b"null" not in encoded or not _has_non_finite_float(value)):
+            return encoded.decode("utf-8")
     return json.dumps(value, ensure_ascii=False, sort_keys=True)
 
 
 def decode_json(value: str | None, default: Any) -> Any:
     if not value:
         return default
+    if ORJSON_AVAILABLE and not _LONG_DIGITS_RE.search(value):
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals written by stdlib json
     return json.loads(value)
 
 
@@ -8,12 +8,23 @@ Captures: command, environment, inputs (with hashes), outputs, execution stats.
 """
 
 import os
+import sys
 import json
+import math
+import re
+import atexit
+import mmap
+import shutil
 import hashlib
+import functools
+import importlib.metadata
+import importlib.util
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # MANIFEST SCHEMA
@@ -21,6 +32,56 @@ from typing import Optional, Dict, List
 
 MANIFEST_VERSION = "1.0"
 
+# Files up to this size are hashed through a single mmap; larger ones stream
+# in HASH_CHUNK_BYTES reads to avoid mapping huge regions.
+HASH_MMAP_MAX_BYTES = 512 * 1024 * 1024
+HASH_CHUNK_BYTES = 1024 * 1024
+
+_HAS_FILE_DIGEST = hasattr(hashlib, "file_digest")
+
+# Optional faster manifest hash: ENSEMBLE_HASH=blake3 (needs the blake3 package).
+# The algorithm name is also the key of the digest in each manifest file entry.
+HASH_ALGORITHM_ENV = "ENSEMBLE_HASH"
+DEFAULT_HASH_ALGORITHM = "sha256"
+MANIFEST_HASH_ALGORITHMS = ("sha256", "blake3")
+BLAKE3_AVAILABLE = importlib.util.find_spec("blake3") is not None
+
+# Hashing releases the GIL, so a few threads overlap disk reads across files
+HASH_MAX_WORKERS = 8
+
+# Digest cache keyed by absolute path and validated by (mtime_ns, size, inode),
+# so unchanged files are not re-hashed across manifest runs. Enabled per
+# workspace by create_manifest and flushed to .notes/.hash_cache.json at exit,
+# dropping entries for files that no longer exist.
+HASH_CACHE_FILENAME = ".hash_cache.json"
+# Files modified more recently than this are hashed but not cached: a rewrite
+# within the same mtime tick and with the same size would otherwise go unseen.
+HASH_CACHE_MIN_AGE_NS = 2 * 1_000_000_000
+_hash_cache: Dict[str, Dict] = {}
+_hash_cache_path: Optional[Path] = None
+_hash_cache_dirty = False
+
+# Status folders under .notes that hold task directories, and the index file
+# mapping task_id -> task directory (relative to .notes) to skip the scan.
+TASK_STATUS_DIRS = ("ACTIVE", "ERRORS", "COMPLETED", "HALTED")
+TASK_INDEX_FILENAME = ".task_index.json"
+
+# Environment fields that distinguish two runs in compare_manifests
+COMPARED_ENV_FIELDS = ("git_commit", "matlab_version", "python_version")
+
+# Optional fast JSON codec for manifest files (stdlib json otherwise)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson reads integers beyond 64 bits as floats; text with digit runs this
+# long is parsed by stdlib json instead
+_LONG_DIGITS_RE = re.compile(rb'[0-9]{19}')
+
+# get_matlab_info result for this process (probing launches MATLAB itself)
+_matlab_info_cache: Optional[Dict] = None
+
 DEFAULT_MANIFEST = {
     "manifest_version": MANIFEST_VERSION,
     "task_id": None,
@@ -64,29 +125,214 @@ DEFAULT_MANIFEST = {
 }
 
 
+def load_hash_cache(workspace: str) -> None:
+    """Enable the on-disk hash cache for a workspace.
+    
+    Entries are read from .notes/.hash_cache.json (if present) and written
+    back atomically when the process exits.
+    """
+    global _hash_cache_path
+    
+    cache_path = Path(workspace) / ".notes" / HASH_CACHE_FILENAME
+    if cache_path == _hash_cache_path:
+        return
+    if _hash_cache_path is None:
+        atexit.register(save_hash_cache)
+    else:
+        save_hash_cache()
+    
+    _hash_cache.clear()
+    _hash_cache_path = cache_path
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+        if isinstance(data, dict):
+            _hash_cache.update(data)
+    except:
+        pass
+
+
+def save_hash_cache() -> None:
+    """Persist the hash cache (write-to-temp + rename) if it changed.
+    
+    Entries for files that no longer exist are pruned before writing.
+    """
+    global _hash_cache_dirty
+    
+    if _hash_cache_path is None or not _hash_cache_dirty:
+        return
+    if not _hash_cache_path.parent.is_dir():
+        return
+    
+    for path in [path for path in _hash_cache if not os.path.exists(path)]:
+        del _hash_cache[path]
+    
+    tmp_path = _hash_cache_path.with_name(f"{_hash_cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(_hash_cache, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, _hash_cache_path)
+        _hash_cache_dirty = False
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def manifest_hash_algorithm() -> str:
+    """Return the manifest hash algorithm selected by ENSEMBLE_HASH.
+    
+    Falls back to sha256 when the variable is unset, unknown, or names
+    blake3 without the package installed.
+    """
+    requested = os.environ.get(HASH_ALGORITHM_ENV, "").strip().lower()
+    if requested == "blake3" and BLAKE3_AVAILABLE:
+        return "blake3"
+    return DEFAULT_HASH_ALGORITHM
+
+
 def compute_file_hash(filepath: str, algorithm: str = "sha256") -> Optional[str]:
     """Compute hash of a file.
     
+    Uses the workspace hash cache when one is loaded and the file's
+    mtime, size and inode are unchanged.
+    
     Args:
         filepath: Path to file
-        algorithm: Hash algorithm (sha256, md5)
+        algorithm: Hash algorithm (sha256, md5, blake3)
         
     Returns:
         Hex digest string or None if file not found
     """
+    return compute_file_hash_and_size(filepath, algorithm)[0]
+
+
+def compute_file_hash_and_size(
+    filepath: str,
+    algorithm: str = "sha256",
+) -> Tuple[Optional[str], Optional[int]]:
+    """Compute hash and size of a file from the same open/stat.
+    
+    Args:
+        filepath: Path to file
+        algorithm: Hash algorithm (sha256, md5, blake3)
+        
+    Returns:
+        (hex digest, size in bytes), or (None, None) if file not found
+    """
+    global _hash_cache_dirty
+    
+    if _hash_cache_path is None:
+        return _hash_file(filepath, algorithm)
+    
+    try:
+        abs_path = os.path.abspath(filepath)
+        st = os.stat(abs_path)
+    except OSError:
+        return None, None
+    
+    entry = _hash_cache.get(abs_path)
+    if (
+        entry
+        and entry.get("mtime_ns") == st.st_mtime_ns
+        and entry.get("size") == st.st_size
+        and entry.get("ino") == st.st_ino
+        and entry.get("algorithm") == algorithm
+    ):
+        return entry.get("digest"), st.st_size
+    
+    digest, size = _hash_file(abs_path, algorithm)
+    if digest is not None and time.time_ns() - st.st_mtime_ns >= HASH_CACHE_MIN_AGE_NS:
+        _hash_cache[abs_path] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "ino": st.st_ino,
+            "algorithm": algorithm,
+            "digest": digest,
+        }
+        _hash_cache_dirty = True
+    elif abs_path in _hash_cache:
+        del _hash_cache[abs_path]
+        _hash_cache_dirty = True
+    return digest, size
+
+
+def _hash_file(filepath: str, algorithm: str) -> Tuple[Optional[str], Optional[int]]:
+    """Hash file contents without consulting the cache; also returns size."""
+    if algorithm == "blake3":
+        try:
+            import blake3
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(filepath)
+            return hasher.hexdigest(), os.path.getsize(filepath)
+        except:
+            return None, None
+    
     try:
-        hasher = hashlib.new(algorithm)
         with open(filepath, 'rb') as f:
-            while chunk := f.read(8192):
-                hasher.update(chunk)
-        return hasher.hexdigest()
+            size = os.fstat(f.fileno()).st_size
+            if _HAS_FILE_DIGEST:
+                # Python 3.11+: the read/update loop runs entirely in C
+                return hashlib.file_digest(f, algorithm).hexdigest(), size
+            hasher = hashlib.new(algorithm)
+            if size == 0:
+                return hasher.hexdigest(), size
+            if size <= HASH_MMAP_MAX_BYTES:
+                # ACCESS_READ is the portable spelling of PROT_READ (works on Windows)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            else:
+                buf = bytearray(HASH_CHUNK_BYTES)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    hasher.update(view[:n])
+        return hasher.hexdigest(), size
     except:
-        return None
+        return None, None
+
+
+def _describe_files(file_paths: List[str]) -> List[Dict]:
+    """Build manifest file entries (path, digest, size) for a list of files.
+    
+    The digest is stored under the algorithm's name ("sha256" by default).
+    Hashes are computed concurrently when more than one file is given.
+    
+    Args:
+        file_paths: File paths to describe
+        
+    Returns:
+        List of file info dicts in input order
+    """
+    algorithm = manifest_hash_algorithm()
+    
+    def hash_one(filepath: str) -> Tuple[Optional[str], Optional[int]]:
+        return compute_file_hash_and_size(filepath, algorithm)
+    
+    if len(file_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(HASH_MAX_WORKERS, len(file_paths))) as executor:
+            results = list(executor.map(hash_one, file_paths))
+    else:
+        results = [hash_one(p) for p in file_paths]
+    
+    return [
+        {"path": filepath, algorithm: digest, "size_bytes": size}
+        for filepath, (digest, size) in zip(file_paths, results)
+    ]
+
+
+def _entry_digest(file_info: Dict) -> Optional[str]:
+    """Return the digest of a manifest file entry, whichever algorithm made it."""
+    for algorithm in MANIFEST_HASH_ALGORITHMS:
+        if file_info.get(algorithm):
+            return file_info[algorithm]
+    return None
 
 
 def get_git_info(workspace: str) -> Dict:
     """Get git repository information.
     
+    Uses a single `git status --porcelain=v2 --branch` call: the header
+    lines carry commit and branch, any other line means the tree is dirty.
+    
     Returns:
         Dict with commit, branch, dirty status
     """
@@ -97,38 +343,28 @@ def get_git_info(workspace: str) -> Dict:
     }
     
     try:
-        # Get current commit
         result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
+            ["git", "status", "--porcelain=v2", "--branch"],
             cwd=workspace,
             capture_output=True,
             text=True,
             timeout=5
         )
-        if result.returncode == 0:
-            info["git_commit"] = result.stdout.strip()[:12]
+        if result.returncode != 0:
+            return info
         
-        # Get current branch
-        result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info["git_branch"] = result.stdout.strip()
-        
-        # Check if dirty
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=workspace,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            info["git_dirty"] = len(result.stdout.strip()) > 0
+        for line in result.stdout.splitlines():
+            if line.startswith("# branch.oid "):
+                oid = line[len("# branch.oid "):].strip()
+                if oid != "(initial)":
+                    info["git_commit"] = oid[:12]
+            elif line.startswith("# branch.head "):
+                head = line[len("# branch.head "):].strip()
+                # Match `git rev-parse --abbrev-ref HEAD` for a detached HEAD
+                info["git_branch"] = "HEAD" if head == "(detached)" else head
+            elif line and not line.startswith("#"):
+                info["git_dirty"] = True
+                break
     except:
         pass
     
@@ -138,13 +374,24 @@ def get_git_info(workspace: str) -> Dict:
 def get_matlab_info() -> Dict:
     """Get MATLAB version and toolbox information.
     
-    Note: This requires MATLAB to be available in PATH.
+    Note: This requires MATLAB to be available in PATH. Starting MATLAB
+    can take tens of seconds, so the result is cached for the process and
+    the probe is skipped outright when no `matlab` executable is found.
     """
+    global _matlab_info_cache
+    
+    if _matlab_info_cache is not None:
+        return dict(_matlab_info_cache)
+    
     info = {
         "matlab_version": None,
         "toolboxes": [],
     }
     
+    if shutil.which("matlab") is None:
+        _matlab_info_cache = info
+        return dict(info)
+    
     try:
         # Try to get MATLAB version
         result = subprocess.run(
@@ -162,13 +409,25 @@ def get_matlab_info() -> Dict:
     except:
         pass
     
-    return info
+    _matlab_info_cache = info
+    return dict(info)
 
 
 def get_python_info() -> Dict:
-    """Get Python version and key packages."""
-    import sys
+    """Get Python version and key packages.
     
+    Package versions come from installed distribution metadata, so nothing
+    is imported; the lookup runs once per process and is reused.
+    """
+    info = _python_info()
+    return {
+        "python_version": info["python_version"],
+        "packages": dict(info["packages"]),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _python_info() -> Dict:
     info = {
         "python_version": sys.version.split()[0],
         "packages": {},
@@ -178,9 +437,8 @@ def get_python_info() -> Dict:
     key_packages = ["numpy", "scipy", "pandas", "matplotlib"]
     for pkg in key_packages:
         try:
-            mod = __import__(pkg)
-            info["packages"][pkg] = getattr(mod, "__version__", "unknown")
-        except:
+            info["packages"][pkg] = importlib.metadata.version(pkg)
+        except importlib.metadata.PackageNotFoundError:
             pass
     
     return info
@@ -211,17 +469,44 @@ def create_manifest(
     Returns:
         Manifest dictionary
     """
-    manifest = DEFAULT_MANIFEST.copy()
-    manifest = json.loads(json.dumps(DEFAULT_MANIFEST))  # Deep copy
-    
-    manifest["task_id"] = task_id
-    manifest["run_id"] = run_id
-    manifest["timestamp_utc"] = datetime.utcnow().isoformat() + "Z"
-    
-    # Command info
-    manifest["command"]["entry_point"] = entry_point
-    manifest["command"]["args"] = args or []
-    manifest["command"]["working_dir"] = working_dir or os.getcwd()
+    # Built from literals (same shape as DEFAULT_MANIFEST) so every call gets
+    # fresh nested containers without a deep copy.
+    manifest = {
+        "manifest_version": MANIFEST_VERSION,
+        "task_id": task_id,
+        "run_id": run_id,
+        "timestamp_utc": datetime.utcnow().isoformat() + "Z",
+        "command": {
+            "entry_point": entry_point,
+            "args": list(args or []),
+            "working_dir": working_dir or os.getcwd(),
+        },
+        "environment": {
+            "matlab_version": None,
+            "python_version": None,
+            "toolboxes": [],
+            "path_additions": [],
+            "env_vars": {},
+            "git_commit": None,
+            "git_branch": None,
+            "git_dirty": False,
+        },
+        "inputs": {
+            "files": [],
+            "parameters": {},
+        },
+        "outputs": {
+            "files": [],
+            "figures": 0,
+            "png_saved": [],
+        },
+        "execution": {
+            "exit_code": None,
+            "duration_sec": None,
+            "memory_peak_mb": None,
+            "error_summary": None,
+        },
+    }
     
     # Environment info
     git_info = get_git_info(workspace)
@@ -232,17 +517,8 @@ def create_manifest(
     
     # Input files with hashes
     if input_files:
-        for filepath in input_files:
-            file_info = {
-                "path": filepath,
-                "sha256": compute_file_hash(filepath),
-                "size_bytes": None,
-            }
-            try:
-                file_info["size_bytes"] = os.path.getsize(filepath)
-            except:
-                pass
-            manifest["inputs"]["files"].append(file_info)
+        load_hash_cache(workspace)
+        manifest["inputs"]["files"].extend(_describe_files(input_files))
     
     # Parameters
     if parameters:
@@ -269,17 +545,7 @@ def update_manifest_outputs(
         Updated manifest
     """
     if output_files:
-        for filepath in output_files:
-            file_info = {
-                "path": filepath,
-                "sha256": compute_file_hash(filepath),
-                "size_bytes": None,
-            }
-            try:
-                file_info["size_bytes"] = os.path.getsize(filepath)
-            except:
-                pass
-            manifest["outputs"]["files"].append(file_info)
+        manifest["outputs"]["files"].extend(_describe_files(output_files))
     
     manifest["outputs"]["figures"] = figures
     manifest["outputs"]["png_saved"] = png_saved or []
@@ -314,6 +580,106 @@ def update_manifest_execution(
     return manifest
 
 
+def _has_non_finite_float(value) -> bool:
+    """Return True if value holds a NaN or infinite float anywhere."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite_float(k) or _has_non_finite_float(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _dump_manifest(manifest: Dict) -> bytes:
+    """Serialize a manifest as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None  # e.g. integers beyond 64 bits; stdlib json handles them
+        # orjson writes NaN/Infinity as null; stdlib json keeps them
+        if data is not None and (b"null" not in data or not _has_non_finite_float(manifest)):
+            return data
+    return json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _parse_manifest(data: bytes) -> Dict:
+    """Parse manifest JSON bytes."""
+    if orjson is not None and not _LONG_DIGITS_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN/Infinity literals written by stdlib json
+    return json.loads(data)
+
+
+def _task_index_path(workspace: str) -> Path:
+    return Path(workspace) / ".notes" / TASK_INDEX_FILENAME
+
+
+def _read_task_index(workspace: str) -> Dict[str, str]:
+    try:
+        data = json.loads(_task_index_path(workspace).read_text(encoding='utf-8'))
+        return data if isinstance(data, dict) else {}
+    except:
+        return {}
+
+
+def touch_task_index(workspace: str, task_id: str, task_dir: Optional[str] = None) -> None:
+    """Record (or with task_dir=None, forget) where a task directory lives.
+    
+    Call after moving a task directory between status folders so the next
+    manifest save/load resolves it without scanning.
+    
+    Args:
+        workspace: Workspace root path
+        task_id: Task ID
+        task_dir: Task directory path (absolute or relative to .notes)
+    """
+    notes_dir = Path(workspace) / ".notes"
+    if not notes_dir.is_dir():
+        return
+    
+    index = _read_task_index(workspace)
+    if task_dir is None:
+        if index.pop(task_id, None) is None:
+            return
+    else:
+        rel_path = os.path.relpath(notes_dir / task_dir, notes_dir)
+        if index.get(task_id) == rel_path:
+            return
+        index[task_id] = rel_path
+    
+    index_path = _task_index_path(workspace)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(index, indent=2, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, index_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _scan_task_dirs(notes_dir: Path, task_id: str):
+    """Yield task directories matching task_id across status folders."""
+    for status_dir in TASK_STATUS_DIRS:
+        for item in (notes_dir / status_dir).glob(f"*{task_id}*"):
+            if item.is_dir():
+                yield item
+
+
+def _indexed_task_dir(workspace: str, task_id: str) -> Optional[Path]:
+    """Task directory from the index, if recorded and still present."""
+    rel_path = _read_task_index(workspace).get(task_id)
+    if not rel_path:
+        return None
+    task_dir = Path(workspace) / ".notes" / rel_path
+    return task_dir if task_dir.is_dir() else None
+
+
 def save_manifest(workspace: str, manifest: Dict) -> Path:
     """Save manifest to run directory.
     
@@ -326,22 +692,30 @@ def save_manifest(workspace: str, manifest: Dict) -> Path:
     if not task_id or not run_id:
         return None
     
-    notes_dir = Path(workspace) / ".notes"
-    
-    # Find task directory
-    for status_dir in ["ACTIVE", "ERRORS", "COMPLETED", "HALTED"]:
-        for item in (notes_dir / status_dir).glob(f"*{task_id}*"):
-            if item.is_dir():
-                run_dir = item / "runs" / run_id
-                run_dir.mkdir(parents=True, exist_ok=True)
-                
-                manifest_file = run_dir / "run.manifest.json"
-                manifest_file.write_text(
-                    json.dumps(manifest, indent=2, ensure_ascii=False),
-                    encoding='utf-8'
-                )
-                return manifest_file
-    
+    # Find task directory: index first, then scan the status folders
+    task_dir = _indexed_task_dir(workspace, task_id)
+    if task_dir is None:
+        notes_dir = Path(workspace) / ".notes"
+        task_dir = next(_scan_task_dirs(notes_dir, task_id), None)
+        if task_dir is None:
+            return None
+        touch_task_index(workspace, task_id, str(task_dir.relative_to(notes_dir)))
+    
+    run_dir = task_dir / "runs" / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    
+    manifest_file = run_dir / "run.manifest.json"
+    manifest_file.write_bytes(_dump_manifest(manifest))
+    return manifest_file
+
+
+def _read_run_manifest(task_dir: Path, run_id: str) -> Optional[Dict]:
+    manifest_file = task_dir / "runs" / run_id / "run.manifest.json"
+    if manifest_file.exists():
+        try:
+            return _parse_manifest(manifest_file.read_bytes())
+        except:
+            pass
     return None
 
 
@@ -351,17 +725,20 @@ def load_manifest(workspace: str, task_id: str, run_id: str) -> Optional[Dict]:
     Returns:
         Manifest dictionary or None
     """
-    notes_dir = Path(workspace) / ".notes"
+    indexed = _indexed_task_dir(workspace, task_id)
+    if indexed is not None:
+        manifest = _read_run_manifest(indexed, run_id)
+        if manifest is not None:
+            return manifest
     
-    for status_dir in ["ACTIVE", "ERRORS", "COMPLETED", "HALTED"]:
-        for item in (notes_dir / status_dir).glob(f"*{task_id}*"):
-            if item.is_dir():
-                manifest_file = item / "runs" / run_id / "run.manifest.json"
-                if manifest_file.exists():
-                    try:
-                        return json.loads(manifest_file.read_text(encoding='utf-8'))
-                    except:
-                        pass
+    notes_dir = Path(workspace) / ".notes"
+    for task_dir in _scan_task_dirs(notes_dir, task_id):
+        if task_dir == indexed:
+            continue
+        manifest = _read_run_manifest(task_dir, run_id)
+        if manifest is not None:
+            touch_task_index(workspace, task_id, str(task_dir.relative_to(notes_dir)))
+            return manifest
     
     return None
 
@@ -384,7 +761,7 @@ def compare_manifests(manifest1: Dict, manifest2: Dict) -> Dict:
     env1 = manifest1.get("environment", {})
     env2 = manifest2.get("environment", {})
     
-    for key in ["git_commit", "matlab_version", "python_version"]:
+    for key in COMPARED_ENV_FIELDS:
         if env1.get(key) != env2.get(key):
             diffs["environment_diffs"].append({
                 "field": key,
@@ -394,8 +771,8 @@ def compare_manifests(manifest1: Dict, manifest2: Dict) -> Dict:
             diffs["identical"] = False
     
     # Compare input file hashes
-    inputs1 = {f["path"]: f.get("sha256") for f in manifest1.get("inputs", {}).get("files", [])}
-    inputs2 = {f["path"]: f.get("sha256") for f in manifest2.get("inputs", {}).get("files", [])}
+    inputs1 = {f["path"]: _entry_digest(f) for f in manifest1.get("inputs", {}).get("files", [])}
+    inputs2 = {f["path"]: _entry_digest(f) for f in manifest2.get("inputs", {}).get("files", [])}
     
     all_paths = set(inputs1.keys()) | set(inputs2.keys())
     for path in all_paths:
@@ -470,7 +847,8 @@ def format_manifest(manifest: Dict, verbose: bool = False) -> str:
         lines.append(f"│  Inputs: {len(input_files)} file(s)")
         if verbose:
             for f in input_files[:3]:
-                h = f.get("sha256", "")[:8] if f.get("sha256") else "N/A"
+                digest = _entry_digest(f)
+                h = digest[:8] if digest else "N/A"
                 lines.append(f"│    • {Path(f['path']).name} ({h}...)")
     
     # Execution
@@ -497,8 +875,13 @@ __all__ = [
     "update_manifest_execution",
     "save_manifest",
     "load_manifest",
+    "touch_task_index",
     "compare_manifests",
     "format_manifest",
     "compute_file_hash",
+    "compute_file_hash_and_size",
+    "manifest_hash_algorithm",
+    "load_hash_cache",
+    "save_hash_cache",
     "get_git_info",
 ]
@@ -80,12 +80,15 @@ def _merge_rules(*rule_groups: list[str]) -> list[str]:
 
 def generate_meeting_id(workspace: str | Path) -> str:
     ensure_meeting_dirs(workspace)
-    today = datetime.now().strftime("%Y%m%d")
-    existing_ids: set[str] = set()
+    prefix = datetime.now().strftime("MTG-%Y%m%d-")
+    max_num = 0
     for directory in candidate_notes_dirs(workspace, "meetings"):
-        for path in sorted(directory.glob(f"MTG-{today}-*.jsonl")):
-            existing_ids.add(path.stem)
-    return f"MTG-{today}-{len(existing_ids) + 1:03d}"
+        for path in directory.glob(f"{prefix}*.jsonl"):
+            try:
+                max_num = max(max_num, int(path.stem.rsplit("-", 1)[-1]))
+            except ValueError:
+                continue
+    return f"{prefix}{max_num + 1:03d}"
 
 
 def meeting_path(workspace: str | Path, meeting_id: str) -> Path:
@@ -6,7 +6,7 @@ Batch 8 orchestration skeleton with a LangGraph-compatible boundary.
 from __future__ import annotations
 
 import importlib.util
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -42,7 +42,7 @@ def assert_langgraph_available() -> None:
         raise LangGraphBlockedError(LANGGRAPH_BLOCKER_REASON)
 
 
-@dataclass
+@dataclass(slots=True)
 class OrchestrationState:
     run_id: str
     graph_kind: str
@@ -62,6 +62,15 @@ class OrchestrationState:
     last_artifact: dict[str, Any] | None = None
 
 
+# Field values are plain JSON types, so a shallow mapping is enough for
+# encoding; dataclasses.asdict would deep-copy every list/dict per checkpoint.
+_STATE_FIELD_NAMES = tuple(item.name for item in fields(OrchestrationState))
+
+
+def _state_payload(state: OrchestrationState) -> dict[str, Any]:
+    return {name: getattr(state, name) for name in _STATE_FIELD_NAMES}
+
+
 class SQLiteCheckpointer:
     def __init__(self, repository: LoopStateRepository):
         self.repository = repository
@@ -71,7 +80,7 @@ class SQLiteCheckpointer:
             run_id=state.run_id,
             graph_kind=state.graph_kind,
             step_name=step_name,
-            state=asdict(state),
+            state=_state_payload(state),
             retry_count=state.retry_count,
             validator_issues=state.validator_issues,
             approval_pending=state.approval_pending,
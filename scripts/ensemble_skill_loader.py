@@ -6,7 +6,9 @@ OpenHands-compatible local skill loader for .agents/skills/*/SKILL.md.
 from __future__ import annotations
 
 import json
+from copy import deepcopy
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -27,7 +29,7 @@ SKILL_ALLOWED_FIELDS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillSummary:
     skill_id: str
     name: str
@@ -53,6 +55,16 @@ def discover_skill_paths(workspace: str | Path) -> list[Path]:
 
 
 def _read_frontmatter(path: Path) -> tuple[dict[str, Any], str]:
+    # Persona resolution re-reads every SKILL.md per delegation; reuse the parse
+    # while the file's (mtime_ns, size) signature is unchanged.
+    stat = path.stat()
+    frontmatter, body = _parse_skill_file(str(path), stat.st_mtime_ns, stat.st_size)
+    return deepcopy(frontmatter), body
+
+
+@lru_cache(maxsize=256)
+def _parse_skill_file(path_str: str, mtime_ns: int, size: int) -> tuple[dict[str, Any], str]:
+    path = Path(path_str)
     text = path.read_text(encoding="utf-8")
     frontmatter_text, body = split_frontmatter(text)
     if not frontmatter_text:
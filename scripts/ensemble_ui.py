@@ -37,6 +37,7 @@ from ensemble_spawn import read_spawn_record, start_spawn, stop_spawn, validate_
 
 DASHBOARD_AUTH_COOKIE = "conitens_dashboard_auth"
 SAFE_API_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._:-]{0,127}$")
+DASHBOARD_EVENT_LIMIT = 80
 
 
 def _host_is_loopback(host: str) -> bool:
@@ -98,7 +99,7 @@ def _dashboard_payload(workspace: str | Path) -> dict[str, Any]:
     replay = ReplayService(workspace)
     return {
         "snapshot": collect_office_snapshot(workspace),
-        "recent_events": load_events(workspace, limit=80),
+        "recent_events": load_events(workspace, limit=DASHBOARD_EVENT_LIMIT),
         "shared_memory": show_memory(workspace, kind="shared"),
         "insights": replay.insights(limit=20),
     }
@@ -222,6 +223,9 @@ def render_web_app_html() -> str:
   <link rel="preconnect" href="https://fonts.googleapis.com">
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@400;500;700&family=JetBrains+Mono:wght@400;500;700&display=swap" rel="stylesheet">
+  <script>
+    window.dashboardBootstrap = fetch('/api/dashboard', { credentials: 'same-origin', headers: { 'Content-Type': 'application/json' } });
+  </script>
   <style>
     :root {
       --bg: #0f1117;
@@ -365,6 +369,70 @@ def render_web_app_html() -> str:
       selectedMemory: null,
       timelineFilter: 'all',
       flash: null,
+      pollFailures: 0,
+      pollTimer: null,
+    };
+
+    const POLL_INTERVAL_MS = 4000;
+    const POLL_MAX_BACKOFF_MS = 30000;
+
+    const TIMELINE_CAPACITY = __TIMELINE_CAPACITY__;
+    const timeline = {
+      items: new Array(TIMELINE_CAPACITY),
+      head: 0,
+      length: 0,
+      seen: new Set(),
+    };
+
+    function timelineKey(event) {
+      return String(event.event_id || ((event.ts_utc || event.ts || '') + '|' + (event.type || '')));
+    }
+
+    function pushTimelineEvent(event) {
+      const key = timelineKey(event);
+      if (timeline.seen.has(key)) return;
+      const evicted = timeline.items[timeline.head];
+      if (evicted) timeline.seen.delete(timelineKey(evicted));
+      timeline.items[timeline.head] = event;
+      timeline.head = (timeline.head + 1) % TIMELINE_CAPACITY;
+      if (timeline.length < TIMELINE_CAPACITY) timeline.length++;
+      timeline.seen.add(key);
+    }
+
+    function timelineAt(offset) {
+      return timeline.items[(timeline.head - 1 - offset + TIMELINE_CAPACITY) % TIMELINE_CAPACITY];
+    }
+
+    const els = {
+      flash: document.getElementById('flash'),
+      spawnProvider: document.getElementById('spawn-provider'),
+      spawnWorkspace: document.getElementById('spawn-workspace'),
+      timelineFilter: document.getElementById('timeline-filter'),
+      clock: document.getElementById('clock'),
+      agentCount: document.getElementById('agent-count'),
+      roomCount: document.getElementById('room-count'),
+      gateCount: document.getElementById('gate-count'),
+      taskCount: document.getElementById('task-count'),
+      eventCount: document.getElementById('event-count'),
+      insightCount: document.getElementById('insight-count'),
+      metrics: document.getElementById('metrics'),
+      agentsList: document.getElementById('agents-list'),
+      roomsList: document.getElementById('rooms-list'),
+      roomDetail: document.getElementById('room-detail'),
+      gatesList: document.getElementById('gates-list'),
+      taskBoard: document.getElementById('task-board'),
+      detailTitle: document.getElementById('detail-title'),
+      taskDetail: document.getElementById('task-detail'),
+      timelineList: document.getElementById('timeline-list'),
+      insightsList: document.getElementById('insights-list'),
+      memoryPanel: document.getElementById('memory-panel'),
+      memoryTarget: document.getElementById('memory-target'),
+      refreshButton: document.getElementById('refresh-button'),
+      contextButton: document.getElementById('context-button'),
+      approveAllButton: document.getElementById('approve-all-button'),
+      spawnForm: document.getElementById('spawn-form'),
+      roomForm: document.getElementById('room-form'),
+      memoryForm: document.getElementById('memory-form'),
     };
 
     function colorFor(status) {
@@ -380,6 +448,74 @@ def render_web_app_html() -> str:
         .replaceAll("'", '&#039;');
     }
 
+    function el(tag, className, text) {
+      const node = document.createElement(tag);
+      if (className) node.className = className;
+      if (text !== undefined) node.textContent = String(text ?? '');
+      return node;
+    }
+
+    function renderNodes(container, nodes, emptyText) {
+      const frag = document.createDocumentFragment();
+      for (const node of nodes) frag.appendChild(node);
+      if (!nodes.length && emptyText) frag.appendChild(el('div', 'empty', emptyText));
+      container.replaceChildren(frag);
+    }
+
+    function renderOptions(select, options, selected) {
+      const frag = document.createDocumentFragment();
+      for (const [value, label] of options) frag.appendChild(new Option(label, value, false, value === selected));
+      select.replaceChildren(frag);
+    }
+
+    function buildAgentRow(agent) {
+      const row = el('div', agent.agent_id === state.selectedAgentId ? 'row active' : 'row');
+      row.dataset.agentId = agent.agent_id;
+      const dot = el('div', 'dot');
+      dot.style.background = colorFor(agent.status);
+      const main = el('div', 'row-main');
+      main.append(
+        el('div', 'row-title', agent.agent_id),
+        el('div', 'row-meta mono', (agent.provider_id || 'unknown') + ' | ' + (agent.status || 'idle')),
+        el('div', 'row-meta mono', (agent.workspace || {}).path || ''),
+      );
+      row.append(dot, main);
+      if (agent.spawn_id && agent.status === 'running') {
+        const stopButton = el('button', 'danger', 'Stop');
+        stopButton.dataset.action = 'stop-spawn';
+        stopButton.dataset.spawnId = agent.spawn_id;
+        row.appendChild(stopButton);
+      }
+      return row;
+    }
+
+    function buildRoomRow(room) {
+      const row = el('div', room.room_id === state.selectedRoomId ? 'row active' : 'row');
+      row.dataset.roomId = room.room_id;
+      const dot = el('div', 'dot');
+      dot.style.background = colorFor(room.status || 'idle');
+      const main = el('div', 'row-main');
+      main.append(
+        el('div', 'row-title', room.room_id),
+        el('div', 'row-meta', room.name || room.room_id),
+        el('div', 'row-meta mono', String(room.message_count || 0) + ' messages'),
+      );
+      row.append(dot, main);
+      return row;
+    }
+
+    function buildTimelineItem(event) {
+      const item = el('div', 'timeline-item');
+      const body = el('div', 'timeline-body');
+      body.append(
+        el('div', 'timeline-type badge', event.type || ''),
+        el('div', '', (event.scope || {}).task_id || (event.payload || {}).task_id || (event.scope || {}).room_id || ''),
+        el('div', 'row-meta mono', (((event.actor || {}).name) || ((event.actor || {}).id) || '') + ' | ' + (event.severity || 'info')),
+      );
+      item.append(el('div', 'timeline-time', (event.ts_utc || event.ts || '').slice(11, 19)), body);
+      return item;
+    }
+
     async function getJson(url, options) {
       const headers = {
         'Content-Type': 'application/json',
@@ -390,6 +526,10 @@ def render_web_app_html() -> str:
         headers,
         credentials: 'same-origin',
       });
+      return readJson(response);
+    }
+
+    async function readJson(response) {
       const text = await response.text();
       const data = text ? JSON.parse(text) : {};
       if (!response.ok) {
@@ -412,18 +552,16 @@ def render_web_app_html() -> str:
     }
 
     function renderFlash() {
-      const root = document.getElementById('flash');
-      if (!state.flash) {
-        root.innerHTML = '';
-        return;
-      }
-      root.innerHTML = '<div class="flash ' + escapeHtml(state.flash.kind) + '">' + escapeHtml(state.flash.text) + '</div>';
+      renderNodes(els.flash, state.flash ? [el('div', 'flash ' + state.flash.kind, state.flash.text)] : []);
     }
 
     async function loadDashboard() {
       try {
-        const payload = await getJson('/api/dashboard');
+        const bootstrap = window.dashboardBootstrap;
+        window.dashboardBootstrap = null;
+        const payload = bootstrap ? await readJson(await bootstrap) : await getJson('/api/dashboard');
         state.payload = payload;
+        for (const event of payload.recent_events || []) pushTimelineEvent(event);
         const tasks = payload.snapshot.tasks || [];
         const agents = payload.snapshot.agents || [];
         const rooms = payload.snapshot.rooms || [];
@@ -433,11 +571,26 @@ def render_web_app_html() -> str:
         if (state.selectedAgentId) await loadAgentMemory(state.selectedAgentId);
         if (state.selectedRoomId) await loadRoomDetail(state.selectedRoomId);
         render();
+        state.pollFailures = 0;
       } catch (error) {
+        state.pollFailures += 1;
         setFlash('error', error.message);
       }
     }
 
+    function schedulePoll() {
+      clearTimeout(state.pollTimer);
+      state.pollTimer = null;
+      if (document.visibilityState === 'hidden') return;
+      const base = Math.min(POLL_INTERVAL_MS * Math.pow(2, state.pollFailures), POLL_MAX_BACKOFF_MS);
+      state.pollTimer = setTimeout(pollDashboard, base * (0.75 + Math.random() * 0.5));
+    }
+
+    async function pollDashboard() {
+      await loadDashboard();
+      schedulePoll();
+    }
+
     async function loadAgentMemory(agentId) {
       const agent = (state.payload?.snapshot?.agents || []).find((item) => item.agent_id === agentId);
       if (!agent || !agent.provider_id) {
@@ -466,12 +619,10 @@ def render_web_app_html() -> str:
     }
 
     function populateSpawnOptions(registry) {
-      const providerSelect = document.getElementById('spawn-provider');
-      const workspaceSelect = document.getElementById('spawn-workspace');
       const providers = registry.providers || [];
       const workspaces = registry.workspaces || [];
-      providerSelect.innerHTML = providers.map((provider) => '<option value="' + escapeHtml(provider.data.provider_id) + '">' + escapeHtml(provider.data.display_name || provider.data.provider_id) + '</option>').join('');
-      workspaceSelect.innerHTML = workspaces.map((workspace) => '<option value="' + escapeHtml(workspace.data.workspace_id) + '">' + escapeHtml(workspace.data.workspace_id) + '</option>').join('');
+      renderOptions(els.spawnProvider, providers.map((provider) => [provider.data.provider_id, provider.data.display_name || provider.data.provider_id]), els.spawnProvider.value);
+      renderOptions(els.spawnWorkspace, workspaces.map((workspace) => [workspace.data.workspace_id, workspace.data.workspace_id]), els.spawnWorkspace.value);
     }
 
     function render() {
@@ -482,62 +633,32 @@ def render_web_app_html() -> str:
       const agents = snapshot.agents || [];
       const rooms = snapshot.rooms || [];
       const questions = (snapshot.questions || []).filter((item) => ['pending', 'auto_selected_waiting_confirm'].includes(item.status));
-      const recentEvents = state.payload.recent_events || [];
       const insights = state.payload.insights || [];
-      const timelinePrefixes = ['all', ...new Set(recentEvents.map((event) => String(event.type || '').split('_')[0].toLowerCase()))];
-      const filterSelect = document.getElementById('timeline-filter');
-      filterSelect.innerHTML = timelinePrefixes.map((prefix) => '<option value="' + escapeHtml(prefix) + '"' + (prefix === state.timelineFilter ? ' selected' : '') + '>' + escapeHtml(prefix) + '</option>').join('');
-
-      document.getElementById('clock').textContent = new Date().toLocaleTimeString();
-      document.getElementById('agent-count').textContent = String(agents.length);
-      document.getElementById('room-count').textContent = String(rooms.length);
-      document.getElementById('gate-count').textContent = String(questions.length);
-      document.getElementById('task-count').textContent = String(tasks.length);
-      document.getElementById('event-count').textContent = String(recentEvents.length);
-      document.getElementById('insight-count').textContent = String(insights.length);
-
-      document.getElementById('metrics').innerHTML = [
+      const prefixSet = new Set();
+      for (let i = timeline.length - 1; i >= 0; i--) prefixSet.add(String(timelineAt(i).type || '').split('_')[0].toLowerCase());
+      const timelinePrefixes = ['all', ...prefixSet];
+      renderOptions(els.timelineFilter, timelinePrefixes.map((prefix) => [prefix, prefix]), state.timelineFilter);
+
+      els.clock.textContent = new Date().toLocaleTimeString();
+      els.agentCount.textContent = String(agents.length);
+      els.roomCount.textContent = String(rooms.length);
+      els.gateCount.textContent = String(questions.length);
+      els.taskCount.textContent = String(tasks.length);
+      els.eventCount.textContent = String(timeline.length);
+      els.insightCount.textContent = String(insights.length);
+
+      renderNodes(els.metrics, [
         ['active', metrics.workflow_runs || 0],
         ['blocked', snapshot.blocked_items?.length || 0],
         ['gates', metrics.gates || 0],
         ['agents', metrics.agent_total || 0],
         ['rooms', metrics.room_total || 0],
-      ].map(([label, value]) => '<div class="metric mono">' + label + ': ' + value + '</div>').join('');
-
-      document.getElementById('agents-list').innerHTML = agents.length
-        ? agents.map((agent) => {
-            const active = agent.agent_id === state.selectedAgentId ? ' active' : '';
-            const statusColor = colorFor(agent.status);
-            const stopButton = agent.spawn_id && agent.status === 'running'
-              ? '<button class="danger" data-action="stop-spawn" data-spawn-id="' + escapeHtml(agent.spawn_id) + '">Stop</button>'
-              : '';
-            return '<div class="row' + active + '" data-agent-id="' + escapeHtml(agent.agent_id) + '">' +
-              '<div class="dot" style="background:' + statusColor + '"></div>' +
-              '<div class="row-main">' +
-                '<div class="row-title">' + escapeHtml(agent.agent_id) + '</div>' +
-                '<div class="row-meta mono">' + escapeHtml(agent.provider_id || 'unknown') + ' | ' + escapeHtml(agent.status || 'idle') + '</div>' +
-                '<div class="row-meta mono">' + escapeHtml((agent.workspace || {}).path || '') + '</div>' +
-              '</div>' +
-              stopButton +
-            '</div>';
-          }).join('')
-        : '<div class="empty">No hired agents yet.</div>';
-
-      document.getElementById('rooms-list').innerHTML = rooms.length
-        ? rooms.map((room) => {
-            const active = room.room_id === state.selectedRoomId ? ' active' : '';
-            return '<div class="row' + active + '" data-room-id="' + escapeHtml(room.room_id) + '">' +
-              '<div class="dot" style="background:' + colorFor(room.status || 'idle') + '"></div>' +
-              '<div class="row-main">' +
-                '<div class="row-title">' + escapeHtml(room.room_id) + '</div>' +
-                '<div class="row-meta">' + escapeHtml(room.name || room.room_id) + '</div>' +
-                '<div class="row-meta mono">' + escapeHtml(String(room.message_count || 0)) + ' messages</div>' +
-              '</div>' +
-            '</div>';
-          }).join('')
-        : '<div class="empty">No rooms recorded.</div>';
-
-      document.getElementById('room-detail').innerHTML = state.selectedRoom
+      ].map(([label, value]) => el('div', 'metric mono', label + ': ' + value)));
+
+      renderNodes(els.agentsList, agents.map(buildAgentRow), 'No hired agents yet.');
+      renderNodes(els.roomsList, rooms.map(buildRoomRow), 'No rooms recorded.');
+
+      els.roomDetail.innerHTML = state.selectedRoom
         ? '<div class="detail-grid">' +
             '<div class="memory-entry"><div class="row-title">' + escapeHtml((state.selectedRoom.room || {}).name || '') + '</div><div class="row-meta mono">' + escapeHtml((state.selectedRoom.room || {}).room_type || 'discussion') + '</div></div>' +
             (state.selectedRoom.timeline || []).slice(-10).map((entry) =>
@@ -547,7 +668,7 @@ def render_web_app_html() -> str:
           '</div>'
         : '<div class="empty">Select a room to inspect its recent transcript.</div>';
 
-      document.getElementById('gates-list').innerHTML = questions.length
+      els.gatesList.innerHTML = questions.length
         ? questions.map((question) =>
             (() => {
               const relatedTask = tasks.find((task) => task.task_id === ((question.context || {}).task_id));
@@ -564,7 +685,7 @@ def render_web_app_html() -> str:
         : '<div class="empty">No pending gates.</div>';
 
       const lanes = ['INBOX', 'ACTIVE', 'DONE-AWAITING-USER', 'COMPLETED', 'HALTED', 'DUMPED'];
-      document.getElementById('task-board').innerHTML = lanes.map((status) => {
+      els.taskBoard.innerHTML = lanes.map((status) => {
         const laneTasks = tasks.filter((task) => task.status === status);
         return '<div class="lane"><div class="lane-title">' + escapeHtml(status) + ' | ' + laneTasks.length + '</div><div class="lane-body">' +
           (laneTasks.length
@@ -580,8 +701,8 @@ def render_web_app_html() -> str:
       const selectedTask = tasks.find((task) => task.task_id === state.selectedTaskId);
       const relatedRuns = (snapshot.workflow_runs || []).filter((run) => run.task_id === state.selectedTaskId);
       const relatedHandoffs = (snapshot.handoffs || []).filter((handoff) => handoff.task_id === state.selectedTaskId);
-      document.getElementById('detail-title').textContent = selectedTask ? selectedTask.task_id : 'No selection';
-      document.getElementById('task-detail').innerHTML = selectedTask
+      els.detailTitle.textContent = selectedTask ? selectedTask.task_id : 'No selection';
+      els.taskDetail.innerHTML = selectedTask
         ? '<div class="detail-grid">' +
             '<div class="split">' +
               '<div class="memory-entry"><div class="row-title">Task</div><div class="row-meta mono">' + escapeHtml(selectedTask.task_id) + '</div><div>' + escapeHtml(selectedTask.title || '') + '</div></div>' +
@@ -596,20 +717,15 @@ def render_web_app_html() -> str:
           '</div>'
         : '<div class="empty">Select a task card to inspect workflow runs and handoffs.</div>';
 
-      document.getElementById('timeline-list').innerHTML = recentEvents.length
-        ? recentEvents.slice().reverse().filter((event) => state.timelineFilter === 'all' || String(event.type || '').split('_')[0].toLowerCase() === state.timelineFilter).map((event) =>
-            '<div class="timeline-item">' +
-              '<div class="timeline-time">' + escapeHtml((event.ts_utc || event.ts || '').slice(11, 19)) + '</div>' +
-              '<div class="timeline-body">' +
-                '<div class="timeline-type badge">' + escapeHtml(event.type || '') + '</div>' +
-                '<div>' + escapeHtml((event.scope || {}).task_id || (event.payload || {}).task_id || (event.scope || {}).room_id || '') + '</div>' +
-                '<div class="row-meta mono">' + escapeHtml(((event.actor || {}).name) || ((event.actor || {}).id) || '') + ' | ' + escapeHtml((event.severity || 'info')) + '</div>' +
-              '</div>' +
-            '</div>'
-          ).join('')
-        : '<div class="empty">No recent events.</div>';
+      const timelineRows = [];
+      for (let i = 0; i < timeline.length; i++) {
+        const event = timelineAt(i);
+        if (state.timelineFilter !== 'all' && String(event.type || '').split('_')[0].toLowerCase() !== state.timelineFilter) continue;
+        timelineRows.push(buildTimelineItem(event));
+      }
+      renderNodes(els.timelineList, timelineRows, timeline.length ? '' : 'No recent events.');
 
-      document.getElementById('insights-list').innerHTML = insights.length
+      els.insightsList.innerHTML = insights.length
         ? insights.slice(0, 12).map((insight) =>
             '<div class="memory-entry">' +
               '<div class="row-title">' + escapeHtml(insight.kind || 'insight') + '</div>' +
@@ -619,8 +735,8 @@ def render_web_app_html() -> str:
           ).join('')
         : '<div class="empty">No insights extracted yet.</div>';
 
-      const memoryRoot = document.getElementById('memory-panel');
-      document.getElementById('memory-target').textContent = state.selectedAgentId || 'Shared';
+      const memoryRoot = els.memoryPanel;
+      els.memoryTarget.textContent = state.selectedAgentId || 'Shared';
       if (state.selectedMemory) {
         const persona = state.selectedMemory.persona?.content || '';
         const longterm = state.selectedMemory.longterm?.entries || [];
@@ -688,12 +804,12 @@ def render_web_app_html() -> str:
       }
     });
 
-    document.getElementById('refresh-button').addEventListener('click', () => loadDashboard());
-    document.getElementById('timeline-filter').addEventListener('change', (event) => {
+    els.refreshButton.addEventListener('click', () => loadDashboard());
+    els.timelineFilter.addEventListener('change', (event) => {
       state.timelineFilter = event.target.value;
       render();
     });
-    document.getElementById('context-button').addEventListener('click', async () => {
+    els.contextButton.addEventListener('click', async () => {
       try {
         await getJson('/api/actions/update-context', { method: 'POST', body: '{}' });
         setFlash('info', 'Context updated.');
@@ -703,7 +819,7 @@ def render_web_app_html() -> str:
       }
     });
 
-    document.getElementById('approve-all-button').addEventListener('click', async () => {
+    els.approveAllButton.addEventListener('click', async () => {
       if (!state.payload) return;
       const questionIds = (state.payload.snapshot.questions || [])
         .filter((item) => ['pending', 'auto_selected_waiting_confirm'].includes(item.status))
@@ -721,7 +837,7 @@ def render_web_app_html() -> str:
       }
     });
 
-    document.getElementById('spawn-form').addEventListener('submit', async (event) => {
+    els.spawnForm.addEventListener('submit', async (event) => {
       event.preventDefault();
       const form = new FormData(event.currentTarget);
       try {
@@ -744,7 +860,7 @@ def render_web_app_html() -> str:
       }
     });
 
-    document.getElementById('room-form').addEventListener('submit', async (event) => {
+    els.roomForm.addEventListener('submit', async (event) => {
       event.preventDefault();
       const form = new FormData(event.currentTarget);
       const name = String(form.get('name') || '').trim();
@@ -764,7 +880,7 @@ def render_web_app_html() -> str:
       }
     });
 
-    document.getElementById('memory-form').addEventListener('submit', async (event) => {
+    els.memoryForm.addEventListener('submit', async (event) => {
       event.preventDefault();
       const form = new FormData(event.currentTarget);
       const text = String(form.get('text') || '').trim();
@@ -790,15 +906,22 @@ def render_web_app_html() -> str:
     });
 
     setInterval(() => {
-      document.getElementById('clock').textContent = new Date().toLocaleTimeString();
+      els.clock.textContent = new Date().toLocaleTimeString();
     }, 1000);
-    setInterval(loadDashboard, 4000);
-    loadDashboard();
+    document.addEventListener('visibilitychange', () => {
+      if (document.visibilityState === 'visible') {
+        pollDashboard();
+      } else {
+        clearTimeout(state.pollTimer);
+        state.pollTimer = null;
+      }
+    });
+    pollDashboard();
   </script>
 </body>
 </html>
 """
-    return html
+    return html.replace("__TIMELINE_CAPACITY__", str(DASHBOARD_EVENT_LIMIT))
 
 
 def _build_handler(workspace: str | Path, web_root: Path, auth_token: str) -> type[BaseHTTPRequestHandler]:
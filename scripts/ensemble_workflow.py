@@ -866,10 +866,15 @@ def _execute_join_step(
     depends_on = step_preview.get("rendered_depends_on") or []
     if not isinstance(depends_on, list):
         depends_on = [depends_on]
+    # Index prior results once instead of rescanning every step per dependency;
+    # the first result for an id wins, as in _find_step_result.
+    results_by_id: dict[str, dict[str, Any]] = {}
+    for prior_step in record.get("steps", []):
+        results_by_id.setdefault(prior_step.get("id"), prior_step)
     unresolved: list[str] = []
     failed: list[str] = []
     for dependency in depends_on:
-        prior = _find_step_result(record, str(dependency))
+        prior = results_by_id.get(str(dependency))
         if prior is None:
             unresolved.append(str(dependency))
             continue
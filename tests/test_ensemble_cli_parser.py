@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import sys
+import unittest
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import ensemble
+
+
+def _run(parse, argv: list[str]) -> tuple[object, str, str, object]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    result, code = None, None
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            result = vars(parse(argv))
+        except SystemExit as exc:
+            code = exc.code
+    return result, stdout.getvalue(), stderr.getvalue(), code
+
+
+class LazyParserTests(unittest.TestCase):
+    def assertMatchesEagerParser(self, parse_lazy, parse_eager, argv: list[str]) -> None:
+        with self.subTest(argv=argv):
+            self.assertEqual(_run(parse_lazy, argv), _run(parse_eager, argv))
+
+    def test_parse_results_help_and_errors_match_full_parser(self) -> None:
+        cases = [
+            [],
+            ["--help"],
+            ["--version"],
+            ["status"],
+            ["status", "--help"],
+            ["-w", "/tmp/ws", "status"],
+            ["--", "status"],
+            ["bogus"],
+            ["new", "--bogus"],
+            ["-w"],
+        ]
+        for argv in cases:
+            self.assertMatchesEagerParser(
+                lambda args: ensemble._build_parser(ensemble._command_token(args)).parse_args(args),
+                lambda args: ensemble._build_parser().parse_args(args),
+                argv,
+            )
+
+    def test_post_parse_errors_report_full_usage(self) -> None:
+        message = "--forward currently supports only the read-only 'status' command."
+        self.assertMatchesEagerParser(
+            lambda args: ensemble._build_parser(ensemble._command_token(args)).error(message),
+            lambda args: ensemble._build_parser().error(message),
+            ["--forward", "new"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
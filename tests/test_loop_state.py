@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import math
 import sys
 import tempfile
 import unittest
@@ -13,7 +14,7 @@ sys.path.insert(0, str(SCRIPTS))
 
 from ensemble_iteration_service import IterationService
 from ensemble_loop_debug import rebuild_loop_state_json
-from ensemble_loop_repository import LoopStateRepository, SCHEMA_VERSION
+from ensemble_loop_repository import LoopStateRepository, SCHEMA_VERSION, decode_json, encode_json
 from ensemble_loop_paths import loop_state_db_path, loop_state_debug_path
 from ensemble_run_service import RunService
 from ensemble_state_restore import StateRestoreService
@@ -589,6 +590,22 @@ class LoopStateTests(unittest.TestCase):
 
             self.assertIsNone(detached["workspace_ref"])
 
+    def test_json_codec_round_trips_big_ints_and_non_finite_floats(self) -> None:
+        value = {"big": 2**70, "nan": float("nan"), "inf": float("-inf"), "none": None}
+
+        stored = encode_json(value)
+        decoded = decode_json(stored, {})
+
+        self.assertEqual(stored, json.dumps(value, ensure_ascii=False, sort_keys=True))
+        self.assertEqual(decoded["big"], 2**70)
+        self.assertIsInstance(decoded["big"], int)
+        self.assertTrue(math.isnan(decoded["nan"]))
+        self.assertEqual(decoded["inf"], float("-inf"))
+        self.assertIsNone(decoded["none"])
+        self.assertTrue(math.isnan(decode_json('{"x": NaN}', {})["x"]))
+        self.assertEqual(decode_json('{"x": Infinity}', {}), {"x": float("inf")})
+        self.assertEqual(decode_json(None, []), [])
+
 
 if __name__ == "__main__":
     unittest.main()
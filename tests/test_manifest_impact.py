@@ -0,0 +1,479 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+
+
+ROOT = Path(__file__).resolve().parents[1]
+SCRIPTS = ROOT / "scripts"
+sys.path.insert(0, str(SCRIPTS))
+
+import ensemble_impact
+from ensemble_impact import (
+    build_dependency_graph,
+    build_reverse_index,
+    calculate_impact_score,
+    extract_matlab_dependencies,
+    extract_python_dependencies,
+    find_dependents,
+    format_impact_result,
+    get_dependency_graph,
+)
+import ensemble_manifest
+from ensemble_manifest import (
+    compare_manifests,
+    compute_file_hash,
+    create_manifest,
+    get_git_info,
+    load_hash_cache,
+    load_manifest,
+    save_hash_cache,
+    save_manifest,
+    update_manifest_outputs,
+)
+
+
+MATLAB_SOURCE = """function out = run_model(x)
+% helper_in_comment(x) and 'ignored.m' should not count
+data = load_inputs(x);
+out = solve_system(data);  % trailing_comment(data)
+run('setup_paths.m');
+fprintf('%d\\n', numel(out));
+end
+"""
+
+
+class ImpactExtractionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_matlab_dependencies_skip_comments_and_builtins(self) -> None:
+        path = self.root / "run_model.m"
+        path.write_text(MATLAB_SOURCE, encoding="utf-8")
+
+        deps = set(extract_matlab_dependencies(str(path)))
+
+        self.assertIn("load_inputs", deps)
+        self.assertIn("solve_system", deps)
+        self.assertIn("setup_paths", deps)
+        self.assertIn("run_model", deps)
+        self.assertNotIn("helper_in_comment", deps)
+        self.assertNotIn("trailing_comment", deps)
+        self.assertNotIn("ignored", deps)
+        self.assertNotIn("fprintf", deps)
+
+    def test_matlab_call_boundaries_match_decoded_text(self) -> None:
+        cases = {
+            "—helper(x)": {"helper"},
+            "\ufffdhelper(x)": {"helper"},
+            "éhelper(x)": set(),
+            "ßhelper(x)": set(),
+            "call_me\u00a0(x)": {"call_me"},
+            "name % comment\r\n(x)": {"name"},
+            "name % inline(x)": set(),
+        }
+        path = self.root / "boundaries.m"
+        for source, expected in cases.items():
+            with self.subTest(source=source):
+                path.write_text(source, encoding="utf-8", newline="")
+                self.assertEqual(set(extract_matlab_dependencies(str(path))), expected)
+
+        path.write_bytes(b"\xffhelper(x)")
+        self.assertEqual(extract_matlab_dependencies(str(path)), ["helper"])
+
+    def test_bare_cr_line_endings_split_lines(self) -> None:
+        matlab = self.root / "cr_only.m"
+        matlab.write_bytes(b"% header comment\rresult = solve_system(x);\rplot_it(result);\r")
+        python = self.root / "cr_only.py"
+        python.write_bytes(b"import numpy\rfrom scipy.linalg import solve\rimport mylib\r")
+
+        for mmap_min_bytes in (ensemble_impact.MMAP_SCAN_MIN_BYTES, 1):
+            with self.subTest(mmap_min_bytes=mmap_min_bytes), \
+                    mock.patch.object(ensemble_impact, "MMAP_SCAN_MIN_BYTES", mmap_min_bytes):
+                self.assertEqual(sorted(extract_matlab_dependencies(str(matlab))), ["plot_it", "solve_system"])
+                self.assertEqual(sorted(extract_python_dependencies(str(python))), ["mylib", "numpy", "scipy"])
+
+    def test_missing_matlab_file_returns_empty(self) -> None:
+        self.assertEqual(extract_matlab_dependencies(str(self.root / "absent.m")), [])
+
+    def test_graph_walks_nested_directories_with_relative_keys(self) -> None:
+        (self.root / "pkg" / "sub").mkdir(parents=True)
+        (self.root / "pkg" / "sub" / "solver.m").write_text("x = helper(1);\n", encoding="utf-8")
+        (self.root / "pkg" / "notes.txt").write_text("helper(1)\n", encoding="utf-8")
+        (self.root / "top.m").write_text("solver(2);\n", encoding="utf-8")
+
+        graph = build_dependency_graph(str(self.root))
+
+        self.assertEqual(
+            graph,
+            {os.path.join("pkg", "sub", "solver.m"): ["helper"], "top.m": ["solver"]},
+        )
+
+    def test_reverse_index_matches_linear_dependents_scan(self) -> None:
+        graph = {
+            "main.m": ["solver", "plot_results"],
+            "run_batch.m": ["solver"],
+            "test_solver.m": ["solver", "helper"],
+            "helper.m": [],
+        }
+        reverse_index = build_reverse_index(graph)
+
+        for target in ("solver.m", "helper", "plot_results.m", "unused.m"):
+            with self.subTest(target=target):
+                self.assertEqual(
+                    find_dependents(target, graph, reverse_index=reverse_index),
+                    find_dependents(target, graph),
+                )
+        self.assertEqual(
+            [f for f, _ in find_dependents("solver.m", graph, reverse_index=reverse_index)],
+            ["main.m", "run_batch.m", "test_solver.m"],
+        )
+
+    def test_cached_graph_reextracts_only_changed_files(self) -> None:
+        (self.root / "a.m").write_text("x = alpha(1);\n", encoding="utf-8")
+        (self.root / "b.m").write_text("y = beta(2);\n", encoding="utf-8")
+        (self.root / "c.m").write_text("z = gamma(3);\n", encoding="utf-8")
+        self.assertEqual(
+            get_dependency_graph(str(self.root)),
+            {"a.m": ["alpha"], "b.m": ["beta"], "c.m": ["gamma"]},
+        )
+
+        (self.root / "b.m").write_text("y = beta_two(2);\n", encoding="utf-8")
+        (self.root / "c.m").unlink()
+        (self.root / "d.m").write_text("w = delta(4);\n", encoding="utf-8")
+        with mock.patch.object(
+            ensemble_impact, "_extract_all", wraps=ensemble_impact._extract_all
+        ) as extract_all:
+            graph = get_dependency_graph(str(self.root))
+
+        self.assertEqual(graph, {"a.m": ["alpha"], "b.m": ["beta_two"], "d.m": ["delta"]})
+        rescanned = sorted(os.path.basename(p) for p in extract_all.call_args.args[1])
+        self.assertEqual(rescanned, ["b.m", "d.m"])
+
+    def test_impact_score_classifies_dependents_once(self) -> None:
+        graph = {
+            "main.m": ["solver"],
+            "run_batch.m": ["solver"],
+            "solver_spec.m": ["solver"],
+            "helper.m": ["solver"],
+        }
+
+        result = calculate_impact_score("solver.m", str(self.root), dependency_graph=graph)
+
+        self.assertEqual(
+            {dep["file"]: dep["role"] for dep in result["dependents"]},
+            {"main.m": "critical", "run_batch.m": "critical", "solver_spec.m": "test", "helper.m": "normal"},
+        )
+        self.assertEqual((result["critical_files"], result["test_files"]), (2, 1))
+        self.assertEqual(result["score"], 55)
+        self.assertEqual(result["risk_level"], "high")
+        self.assertIn("🧪 solver_spec.m", format_impact_result(result))
+
+    def test_parallel_graph_matches_serial_scan(self) -> None:
+        for index in range(12):
+            (self.root / f"step_{index}.m").write_text(
+                f"y = helper_{index % 3}(x);\n", encoding="utf-8"
+            )
+
+        with mock.patch.object(ensemble_impact, "PARALLEL_SCAN_MIN_BYTES", 0), \
+                mock.patch.object(ensemble_impact.os, "cpu_count", return_value=2):
+            parallel = build_dependency_graph(str(self.root))
+        serial = build_dependency_graph(str(self.root))
+
+        self.assertEqual(parallel, serial)
+        self.assertEqual(parallel["step_4.m"], ["helper_1"])
+
+    def test_single_cpu_scan_skips_process_pool(self) -> None:
+        (self.root / "step.m").write_text("y = helper(x);\n", encoding="utf-8")
+
+        with mock.patch.object(ensemble_impact, "PARALLEL_SCAN_MIN_BYTES", 0), \
+                mock.patch.object(ensemble_impact.os, "cpu_count", return_value=1), \
+                mock.patch.object(ensemble_impact, "ProcessPoolExecutor") as pool:
+            graph = build_dependency_graph(str(self.root))
+
+        pool.assert_not_called()
+        self.assertEqual(graph, {"step.m": ["helper"]})
+
+
+class ManifestHashTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._reset_hash_cache()
+
+    def tearDown(self) -> None:
+        self._reset_hash_cache()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _reset_hash_cache() -> None:
+        ensemble_manifest._hash_cache.clear()
+        ensemble_manifest._hash_cache_path = None
+        ensemble_manifest._hash_cache_dirty = False
+
+    def test_hash_matches_hashlib_for_empty_small_and_chunked_files(self) -> None:
+        payloads = {"empty.bin": b"", "small.bin": b"abc" * 100, "large.bin": bytes(range(256)) * 4099}
+        for name, payload in payloads.items():
+            path = self.root / name
+            path.write_bytes(payload)
+            expected = hashlib.sha256(payload).hexdigest()
+            with self.subTest(name=name):
+                self.assertEqual(compute_file_hash(str(path)), expected)
+
+        # Exercise the pre-3.11 fallback (mmap, then chunked reads) as well
+        saved = (ensemble_manifest._HAS_FILE_DIGEST, ensemble_manifest.HASH_MMAP_MAX_BYTES)
+        try:
+            ensemble_manifest._HAS_FILE_DIGEST = False
+            for limit in (saved[1], 1):
+                ensemble_manifest.HASH_MMAP_MAX_BYTES = limit
+                with self.subTest(mmap_limit=limit):
+                    self.assertEqual(
+                        compute_file_hash(str(self.root / "large.bin")),
+                        hashlib.sha256(payloads["large.bin"]).hexdigest(),
+                    )
+        finally:
+            ensemble_manifest._HAS_FILE_DIGEST, ensemble_manifest.HASH_MMAP_MAX_BYTES = saved
+
+    def test_missing_file_hash_is_none(self) -> None:
+        self.assertIsNone(compute_file_hash(str(self.root / "absent.bin")))
+
+    def test_manifest_file_entries_keep_input_order(self) -> None:
+        paths = []
+        for index in range(5):
+            path = self.root / f"input_{index}.dat"
+            path.write_bytes(b"x" * index)
+            paths.append(str(path))
+        paths.append(str(self.root / "missing.dat"))
+
+        manifest = create_manifest(str(self.root), "TASK-1", "run-1", "main.m", input_files=paths)
+        entries = manifest["inputs"]["files"]
+
+        self.assertEqual([entry["path"] for entry in entries], paths)
+        self.assertEqual(entries[3]["size_bytes"], 3)
+        self.assertEqual(entries[3]["sha256"], hashlib.sha256(b"xxx").hexdigest())
+        self.assertEqual(entries[-1], {"path": paths[-1], "sha256": None, "size_bytes": None})
+
+        update_manifest_outputs(manifest, output_files=paths[:2])
+        self.assertEqual([entry["path"] for entry in manifest["outputs"]["files"]], paths[:2])
+
+    def test_blake3_request_falls_back_to_sha256_when_unavailable(self) -> None:
+        with mock.patch.dict(os.environ, {"ENSEMBLE_HASH": "blake3"}), \
+                mock.patch.object(ensemble_manifest, "BLAKE3_AVAILABLE", False):
+            self.assertEqual(ensemble_manifest.manifest_hash_algorithm(), "sha256")
+        with mock.patch.dict(os.environ, {"ENSEMBLE_HASH": "blake3"}), \
+                mock.patch.object(ensemble_manifest, "BLAKE3_AVAILABLE", True):
+            self.assertEqual(ensemble_manifest.manifest_hash_algorithm(), "blake3")
+
+    def test_create_manifest_matches_default_schema_without_sharing_state(self) -> None:
+        first = create_manifest(str(self.root), "TASK-1", "run-1", "main.m")
+        second = create_manifest(str(self.root), "TASK-1", "run-2", "main.m")
+
+        def shape(value):
+            if isinstance(value, dict):
+                return {key: shape(item) for key, item in value.items()}
+            return None
+
+        self.assertEqual(shape(first), shape(ensemble_manifest.DEFAULT_MANIFEST))
+        first["inputs"]["files"].append({"path": "x"})
+        self.assertEqual(second["inputs"]["files"], [])
+        self.assertEqual(ensemble_manifest.DEFAULT_MANIFEST["inputs"]["files"], [])
+
+    def test_git_info_reads_commit_branch_and_dirty_state(self) -> None:
+        self.assertEqual(
+            get_git_info(str(self.root)),
+            {"git_commit": None, "git_branch": None, "git_dirty": False},
+        )
+
+        subprocess.run(["git", "init", "-q", "-b", "main"], cwd=self.root, check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], cwd=self.root, check=True)
+        subprocess.run(["git", "config", "user.email", "test@example.invalid"], cwd=self.root, check=True)
+        (self.root / "a.txt").write_text("a\n", encoding="utf-8")
+        subprocess.run(["git", "add", "a.txt"], cwd=self.root, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=self.root, check=True)
+        head = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=self.root, check=True, capture_output=True, text=True
+        ).stdout.strip()
+
+        info = get_git_info(str(self.root))
+        self.assertEqual(info, {"git_commit": head[:12], "git_branch": "main", "git_dirty": False})
+
+        (self.root / "b.txt").write_text("b\n", encoding="utf-8")
+        self.assertTrue(get_git_info(str(self.root))["git_dirty"])
+
+    def test_matlab_probe_is_skipped_without_executable(self) -> None:
+        with mock.patch.object(ensemble_manifest, "get_matlab_info") as probe:
+            create_manifest(str(self.root), "TASK-1", "run-1", "main.m")
+        probe.assert_not_called()
+
+        with mock.patch.object(ensemble_manifest, "_matlab_info_cache", None), \
+                mock.patch.object(ensemble_manifest.shutil, "which", return_value=None), \
+                mock.patch.object(ensemble_manifest.subprocess, "run") as run:
+            info = ensemble_manifest.get_matlab_info()
+        self.assertEqual(info, {"matlab_version": None, "toolboxes": []})
+        run.assert_not_called()
+
+    def test_manifest_save_load_round_trip_keeps_unicode(self) -> None:
+        (self.root / ".notes" / "ACTIVE" / "TASK-7_demo").mkdir(parents=True)
+        manifest = create_manifest(
+            str(self.root), "TASK-7", "run-001", "main.m", parameters={"label": "실험 α"}
+        )
+
+        saved = save_manifest(str(self.root), manifest)
+
+        self.assertIsNotNone(saved)
+        self.assertIn("실험 α", saved.read_text(encoding="utf-8"))
+        self.assertEqual(load_manifest(str(self.root), "TASK-7", "run-001"), manifest)
+
+    def test_manifest_round_trip_keeps_big_ints_and_non_finite_floats(self) -> None:
+        (self.root / ".notes" / "ACTIVE" / "TASK-8_demo").mkdir(parents=True)
+        manifest = create_manifest(
+            str(self.root), "TASK-8", "run-001", "main.m",
+            parameters={"seed": 2**70, "tol": float("nan"), "limit": float("inf")},
+        )
+
+        saved = save_manifest(str(self.root), manifest)
+        text = saved.read_text(encoding="utf-8")
+        self.assertIn(str(2**70), text)
+        self.assertIn("NaN", text)
+        self.assertIn("Infinity", text)
+
+        loaded = load_manifest(str(self.root), "TASK-8", "run-001")
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded["inputs"]["parameters"]["seed"], 2**70)
+        self.assertIsInstance(loaded["inputs"]["parameters"]["seed"], int)
+        self.assertTrue(math.isnan(loaded["inputs"]["parameters"]["tol"]))
+        self.assertEqual(loaded["inputs"]["parameters"]["limit"], float("inf"))
+
+        saved.write_text('{"run_id": "run-001", "inputs": {"parameters": {"tol": NaN, "limit": -Infinity}}}', encoding="utf-8")
+        loaded = load_manifest(str(self.root), "TASK-8", "run-001")
+        self.assertIsNotNone(loaded)
+        self.assertTrue(math.isnan(loaded["inputs"]["parameters"]["tol"]))
+        self.assertEqual(loaded["inputs"]["parameters"]["limit"], float("-inf"))
+
+    def test_compare_manifests_reports_parameter_changes(self) -> None:
+        path = self.root / "input.dat"
+        path.write_bytes(b"data")
+        first = create_manifest(str(self.root), "T", "run-1", "main.m", input_files=[str(path)], parameters={"n": 1})
+        second = create_manifest(str(self.root), "T", "run-2", "main.m", input_files=[str(path)], parameters={"n": 1})
+
+        self.assertTrue(compare_manifests(first, second)["identical"])
+
+        second["inputs"]["parameters"]["n"] = 2
+        diffs = compare_manifests(first, second)
+        self.assertFalse(diffs["identical"])
+        self.assertEqual(diffs["parameter_diffs"], [{"param": "n", "run1": 1, "run2": 2}])
+
+    def test_task_index_follows_moved_task_directory(self) -> None:
+        notes = self.root / ".notes"
+        (notes / "ACTIVE" / "TASK-9_demo").mkdir(parents=True)
+        (notes / "COMPLETED").mkdir()
+        manifest = create_manifest(str(self.root), "TASK-9", "run-001", "main.m")
+
+        save_manifest(str(self.root), manifest)
+        index_file = notes / ensemble_manifest.TASK_INDEX_FILENAME
+        self.assertEqual(
+            json.loads(index_file.read_text(encoding="utf-8")),
+            {"TASK-9": os.path.join("ACTIVE", "TASK-9_demo")},
+        )
+
+        (notes / "ACTIVE" / "TASK-9_demo").rename(notes / "COMPLETED" / "TASK-9_demo")
+        self.assertEqual(load_manifest(str(self.root), "TASK-9", "run-001"), manifest)
+        self.assertEqual(
+            json.loads(index_file.read_text(encoding="utf-8")),
+            {"TASK-9": os.path.join("COMPLETED", "TASK-9_demo")},
+        )
+
+    def test_task_index_stores_notes_relative_path_for_relative_workspace(self) -> None:
+        notes = self.root / "relws" / ".notes"
+        (notes / "ACTIVE" / "TASK-5_x").mkdir(parents=True)
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        self.addCleanup(os.chdir, cwd)
+        manifest = create_manifest("relws", "TASK-5", "run-001", "main.m")
+
+        save_manifest("relws", manifest)
+        index_file = notes / ensemble_manifest.TASK_INDEX_FILENAME
+        self.assertEqual(
+            json.loads(index_file.read_text(encoding="utf-8")),
+            {"TASK-5": os.path.join("ACTIVE", "TASK-5_x")},
+        )
+        with mock.patch.object(ensemble_manifest, "_scan_task_dirs", side_effect=AssertionError("scanned")):
+            self.assertEqual(load_manifest("relws", "TASK-5", "run-001"), manifest)
+
+    @staticmethod
+    def _write_aged(path: Path, data: bytes, mtime: int = 1_600_000_000) -> None:
+        path.write_bytes(data)
+        os.utime(path, (mtime, mtime))
+
+    def test_hash_cache_round_trips_and_detects_changes(self) -> None:
+        (self.root / ".notes").mkdir()
+        path = self.root / "input.dat"
+        self._write_aged(path, b"first")
+
+        load_hash_cache(str(self.root))
+        self.assertEqual(compute_file_hash(str(path)), hashlib.sha256(b"first").hexdigest())
+        save_hash_cache()
+
+        cache_file = self.root / ".notes" / ensemble_manifest.HASH_CACHE_FILENAME
+        self.assertIn(os.path.abspath(path), cache_file.read_text(encoding="utf-8"))
+
+        self._reset_hash_cache()
+        load_hash_cache(str(self.root))
+        self.assertEqual(len(ensemble_manifest._hash_cache), 1)
+
+        path.write_bytes(b"second!")
+        self.assertEqual(compute_file_hash(str(path)), hashlib.sha256(b"second!").hexdigest())
+
+    def test_hash_cache_skips_recent_files_and_tracks_inode(self) -> None:
+        (self.root / ".notes").mkdir()
+        load_hash_cache(str(self.root))
+
+        recent = self.root / "recent.dat"
+        recent.write_bytes(b"fresh")
+        self.assertEqual(compute_file_hash(str(recent)), hashlib.sha256(b"fresh").hexdigest())
+        self.assertNotIn(os.path.abspath(recent), ensemble_manifest._hash_cache)
+
+        path = self.root / "input.dat"
+        self._write_aged(path, b"aaaa")
+        compute_file_hash(str(path))
+        self.assertIn(os.path.abspath(path), ensemble_manifest._hash_cache)
+
+        # Same size and mtime, but a different file replaced it
+        replacement = self.root / "replacement.dat"
+        self._write_aged(replacement, b"bbbb")
+        os.replace(replacement, path)
+        self.assertEqual(compute_file_hash(str(path)), hashlib.sha256(b"bbbb").hexdigest())
+
+    def test_hash_cache_prunes_deleted_files_on_save(self) -> None:
+        (self.root / ".notes").mkdir()
+        kept = self.root / "kept.dat"
+        removed = self.root / "removed.dat"
+        self._write_aged(kept, b"kept")
+        self._write_aged(removed, b"removed")
+
+        load_hash_cache(str(self.root))
+        compute_file_hash(str(kept))
+        compute_file_hash(str(removed))
+        removed.unlink()
+        save_hash_cache()
+
+        cache_file = self.root / ".notes" / ensemble_manifest.HASH_CACHE_FILENAME
+        self.assertEqual(
+            list(json.loads(cache_file.read_text(encoding="utf-8"))),
+            [os.path.abspath(kept)],
+        )
+
+if __name__ == "__main__":
+    unittest.main()
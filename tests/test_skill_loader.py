@@ -119,6 +119,16 @@ class SkillLoaderTests(unittest.TestCase):
         self.assertEqual(len(resolved), 1)
         self.assertEqual(resolved[0]["skill_id"], "sample-skill")
 
+    def test_cached_parse_tracks_edits_and_isolates_callers(self) -> None:
+        root = self.prepare_workspace()
+        path = root / ".agents" / "skills" / "sample-skill" / "SKILL.md"
+        first = load_skill_content(path)
+        first["frontmatter"]["triggers"].append("mutated")
+        self.assertEqual(load_skill_content(path)["frontmatter"]["triggers"], ["sample"])
+
+        path.write_text(VALID_SKILL.replace('"Sample skill"', '"Edited sample skill"'), encoding="utf-8")
+        self.assertEqual(load_skill_metadata(path).description, "Edited sample skill")
+
 
 if __name__ == "__main__":
     unittest.main()
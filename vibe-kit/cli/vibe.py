@@ -12,7 +12,6 @@ Usage:
 """
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
@@ -20,43 +19,85 @@ from pathlib import Path
 
 VERSION = "1.0.0"
 
+# Status glyphs, with the ASCII tags the packs print when stdout can't encode them
+_UNICODE = (sys.stdout.encoding or "").lower().replace("-", "").startswith("utf")
+_OK = "✓" if _UNICODE else "[OK]"
+_FAIL = "✗" if _UNICODE else "[ERROR]"
+_WARN = "⚠" if _UNICODE else "[WARN]"
+_PACK = "📦" if _UNICODE else "[PACK]"
+_DONE = "✅" if _UNICODE else "[OK]"
+_SEP = "=" * 40
+
+# Path components that disqualify a source file from language detection
+PY_EXCLUDED_DIRS = frozenset({".venv", "venv", "__pycache__", ".git", ".vibe", "node_modules"})
+JS_EXCLUDED_DIRS = frozenset({"node_modules", ".git", ".vibe", "dist", "build"})
+
+
+def _count_source_files(root: str):
+    """Count Python and JS files under root in one walk.
+    
+    Each subtree tracks whether it is still eligible per language, and
+    directories excluded for both (node_modules, .git, .vibe) are never entered.
+    """
+    py_count = js_count = 0
+    root_parts = Path(root).parts
+    stack = [(root, PY_EXCLUDED_DIRS.isdisjoint(root_parts), JS_EXCLUDED_DIRS.isdisjoint(root_parts))]
+    while stack:
+        path, py_ok, js_ok = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    sub_py = py_ok and name not in PY_EXCLUDED_DIRS
+                    sub_js = js_ok and name not in JS_EXCLUDED_DIRS
+                    if sub_py or sub_js:
+                        stack.append((entry.path, sub_py, sub_js))
+                elif py_ok and name.endswith(".py"):
+                    py_count += 1
+                elif js_ok and name.endswith(".js"):
+                    js_count += 1
+    return py_count, js_count
+
 
 def get_pack_dir(root: str) -> Path:
     """Detect which language pack to use."""
-    # Check for Python files
-    py_files = list(Path(root).rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in f.parts for x in [".venv", "venv", "__pycache__", ".git", ".vibe", "node_modules"])]
-    
-    # Check for JS files
-    js_files = list(Path(root).rglob("*.js"))
-    js_files = [f for f in js_files if not any(x in f.parts for x in ["node_modules", ".git", ".vibe", "dist", "build"])]
+    py_count, js_count = _count_source_files(root)
     
     # Return appropriate pack
     vibe_kit_root = Path(__file__).parent.parent
     
-    if len(py_files) > len(js_files):
+    if py_count > js_count:
         return vibe_kit_root / "packs" / "python"
-    elif js_files:
+    elif js_count:
         return vibe_kit_root / "packs" / "js"
     else:
         return vibe_kit_root / "packs" / "python"  # Default
 
 
-def cmd_status(args):
-    """Check vibe-kit setup status."""
-    root = os.path.abspath(args.root)
+def _status_report(root):
+    """Run the setup checks for a project root.
+    
+    Returns a JSON-serializable report and the exit code. Checks stop at the
+    first error, mirroring the text output.
+    """
+    import json
     vibe_dir = os.path.join(root, ".vibe")
+    report = {"version": VERSION, "root": root, "checks": [], "pack": None}
+    checks = report["checks"]
     
-    print(f"vibe-kit v{VERSION}")
-    print("=" * 40)
+    def check(name, status, message, hint=None):
+        checks.append({"name": name, "status": status, "message": message, "hint": hint})
     
     # Check .vibe directory
     if os.path.isdir(vibe_dir):
-        print(f"✓ .vibe directory found")
+        check("vibe_dir", "ok", ".vibe directory found")
     else:
-        print(f"✗ .vibe directory NOT found")
-        print(f"  Run: mkdir -p .vibe/{{context,db,baselines}}")
-        return 2
+        check("vibe_dir", "error", ".vibe directory NOT found", "mkdir -p .vibe/{context,db,baselines}")
+        return report, 2
     
     # Check config
     config_path = os.path.join(vibe_dir, "config.json")
@@ -64,13 +105,13 @@ def cmd_status(args):
         try:
             with open(config_path, "r") as f:
                 config = json.load(f)
-            print(f"✓ config.json found (project: {config.get('project_name', 'unknown')})")
+            check("config", "ok", f"config.json found (project: {config.get('project_name', 'unknown')})")
         except:
-            print(f"✗ config.json invalid")
-            return 2
+            check("config", "error", "config.json invalid")
+            return report, 2
     else:
-        print(f"✗ config.json NOT found")
-        return 2
+        check("config", "error", "config.json NOT found")
+        return report, 2
     
     # Check baseline
     baseline_path = os.path.join(vibe_dir, "baselines", "pyright_baseline.json")
@@ -78,18 +119,18 @@ def cmd_status(args):
         try:
             with open(baseline_path, "r") as f:
                 baseline = json.load(f)
-            print(f"✓ Baseline found ({baseline.get('error_count', '?')} errors)")
+            check("baseline", "ok", f"Baseline found ({baseline.get('error_count', '?')} errors)")
         except:
-            print(f"⚠ Baseline invalid")
+            check("baseline", "warn", "Baseline invalid")
     else:
-        print(f"⚠ No baseline (run: vibe baseline --init)")
+        check("baseline", "warn", "No baseline (run: vibe baseline --init)")
     
     # Check LATEST_CONTEXT
     context_path = os.path.join(vibe_dir, "context", "LATEST_CONTEXT.md")
     if os.path.exists(context_path):
-        print(f"✓ LATEST_CONTEXT.md found")
+        check("context", "ok", "LATEST_CONTEXT.md found")
     else:
-        print(f"⚠ No LATEST_CONTEXT (run: vibe doctor --context)")
+        check("context", "warn", "No LATEST_CONTEXT (run: vibe doctor --context)")
     
     # Check upstream
     upstream_path = os.path.join(vibe_dir, "UPSTREAM.json")
@@ -97,24 +138,47 @@ def cmd_status(args):
         try:
             with open(upstream_path, "r") as f:
                 upstream = json.load(f)
-            print(f"✓ Upstream tracked: {upstream.get('repo', 'unknown')}")
+            check("upstream", "ok", f"Upstream tracked: {upstream.get('repo', 'unknown')}")
         except:
-            print(f"⚠ UPSTREAM.json invalid")
+            check("upstream", "warn", "UPSTREAM.json invalid")
     else:
-        print(f"⚠ No upstream tracking")
+        check("upstream", "warn", "No upstream tracking")
     
     # Detect language
-    pack_dir = get_pack_dir(root)
-    print(f"\n📦 Active pack: {pack_dir.name}")
-    
-    print("\n" + "=" * 40)
-    print("✅ vibe-kit is configured")
-    return 0
+    report["pack"] = get_pack_dir(root).name
+    return report, 0
+
+
+_STATUS_GLYPHS = {"ok": _OK, "warn": _WARN, "error": _FAIL}
+
+
+def _render_status(report, code):
+    lines = [f"vibe-kit v{report['version']}", _SEP]
+    for item in report["checks"]:
+        lines.append(f"{_STATUS_GLYPHS[item['status']]} {item['message']}")
+        if item["hint"]:
+            lines.append(f"  Run: {item['hint']}")
+    if code == 0:
+        lines.append(f"\n{_PACK} Active pack: {report['pack']}")
+        lines.append("\n" + _SEP)
+        lines.append(f"{_DONE} vibe-kit is configured")
+    return "\n".join(lines) + "\n"
+
+
+def cmd_status(args):
+    """Check vibe-kit setup status."""
+    report, code = _status_report(args.root)
+    if args.json:
+        import json
+        sys.stdout.write(json.dumps(report) + "\n")
+    else:
+        sys.stdout.write(_render_status(report, code))
+    return code
 
 
 def cmd_precommit(args):
     """Run pre-commit gate."""
-    root = os.path.abspath(args.root)
+    root = args.root
     pack_dir = get_pack_dir(root)
     
     precommit_script = pack_dir / "precommit.py"
@@ -141,7 +205,7 @@ def cmd_precommit(args):
 
 def cmd_doctor(args):
     """Run full project scan."""
-    root = os.path.abspath(args.root)
+    root = args.root
     pack_dir = get_pack_dir(root)
     
     doctor_script = pack_dir / "doctor.py"
@@ -170,7 +234,7 @@ def cmd_doctor(args):
 
 def cmd_baseline(args):
     """Initialize or check baseline."""
-    root = os.path.abspath(args.root)
+    root = args.root
     pack_dir = get_pack_dir(root)
     
     gate_script = pack_dir / "gate_pyright.py"
@@ -193,7 +257,7 @@ def cmd_baseline(args):
 
 def cmd_index(args):
     """Run indexer."""
-    root = os.path.abspath(args.root)
+    root = args.root
     pack_dir = get_pack_dir(root)
     
     indexer_script = pack_dir / "indexer.py"
@@ -214,11 +278,16 @@ def cmd_index(args):
     return result.returncode
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="vibe-kit: Agent-friendly development environment toolkit",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+COMMANDS = {
+    "status": cmd_status,
+    "precommit": cmd_precommit,
+    "doctor": cmd_doctor,
+    "baseline": cmd_baseline,
+    "index": cmd_index,
+}
+
+
+EPILOG = """
 Commands:
   status      Check vibe-kit setup
   precommit   Run staged-only pre-commit gate
@@ -232,54 +301,138 @@ Examples:
   vibe doctor --context
   vibe baseline --init
 """
-    )
-    
-    parser.add_argument("--version", action="version", version=f"vibe-kit {VERSION}")
-    parser.add_argument("--root", default=".", help="Project root directory")
-    
-    subparsers = parser.add_subparsers(dest="command", help="Command to run")
-    
-    # status
+
+
+def _add_status_parser(subparsers):
     sp_status = subparsers.add_parser("status", help="Check vibe-kit setup")
-    
-    # precommit
+    sp_status.add_argument("--json", action="store_true", help="Print the report as JSON")
+
+
+def _add_precommit_parser(subparsers):
     sp_precommit = subparsers.add_parser("precommit", help="Run pre-commit gate")
     sp_precommit.add_argument("--no-baseline", action="store_true", help="Skip baseline gate")
     sp_precommit.add_argument("--no-cycle", action="store_true", help="Skip cycle check")
     sp_precommit.add_argument("--all", action="store_true", help="Check all files")
-    
-    # doctor
+
+
+def _add_doctor_parser(subparsers):
     sp_doctor = subparsers.add_parser("doctor", help="Full project scan")
     sp_doctor.add_argument("--output", "-o", help="Output JSON report file")
     sp_doctor.add_argument("--upstream", action="store_true", help="Check upstream version")
     sp_doctor.add_argument("--context", action="store_true", help="Generate LATEST_CONTEXT.md")
     sp_doctor.add_argument("--strict", action="store_true", help="Exit 1 on any issue")
-    
-    # baseline
+
+
+def _add_baseline_parser(subparsers):
     sp_baseline = subparsers.add_parser("baseline", help="Initialize/check baseline")
     sp_baseline.add_argument("--init", action="store_true", help="Initialize/update baseline")
-    
-    # index
+
+
+def _add_index_parser(subparsers):
     sp_index = subparsers.add_parser("index", help="Run project indexer")
     sp_index.add_argument("--output", "-o", help="Output JSON file")
+
+
+SUBPARSER_BUILDERS = {
+    "status": _add_status_parser,
+    "precommit": _add_precommit_parser,
+    "doctor": _add_doctor_parser,
+    "baseline": _add_baseline_parser,
+    "index": _add_index_parser,
+}
+
+
+def _command_token(argv):
+    """Return the first positional argument, skipping the global --root value.
+
+    Returns None when top-level help is requested before any command.
+    """
+    skip_value = False
+    for arg in argv:
+        if skip_value:
+            skip_value = False
+        elif arg in ("-h", "--help"):
+            return None
+        elif arg == "--root":
+            skip_value = True
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def _build_parser(command=None):
+    """Build the CLI parser with only command's subparser, or all of them.
     
-    args = parser.parse_args()
+    Help, typos and a bare invocation get every subcommand so usage lists them all.
+    """
+    parser = _CommandParser(
+        description="vibe-kit: Agent-friendly development environment toolkit",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=EPILOG,
+    )
     
-    if args.command is None:
-        parser.print_help()
-        return 0
+    parser.add_argument("--version", action="version", version=f"vibe-kit {VERSION}")
+    parser.add_argument("--root", default=".", help="Project root directory")
+    
+    subparsers = parser.add_subparsers(dest="command", help="Command to run")
+    
+    if command in SUBPARSER_BUILDERS:
+        SUBPARSER_BUILDERS[command](subparsers)
+        parser.partial = True
+    else:
+        for build in SUBPARSER_BUILDERS.values():
+            build(subparsers)
+    return parser
+
+
+class _FullParseRequired(Exception):
+    """Raised when a partially built parser hits an error mid-parse."""
+
+
+class _CommandParser(argparse.ArgumentParser):
+    """Top-level parser; a partially built one reports errors through the full tree.
+    
+    A parse error re-parses the same arguments with every subcommand added, so
+    the message (e.g. the invalid-choice list) matches the full parser's.
+    """
+    
+    partial = False
+    _parsing = False
+    
+    def parse_args(self, args=None, namespace=None):
+        if not self.partial:
+            return super().parse_args(args, namespace)
+        self._parsing = True
+        try:
+            return super().parse_args(args, namespace)
+        except _FullParseRequired:
+            return _build_parser().parse_args(args, namespace)
+        finally:
+            self._parsing = False
+    
+    def error(self, message):
+        if self.partial:
+            if self._parsing:
+                raise _FullParseRequired(message)
+            _build_parser().error(message)
+        super().error(message)
+
+
+def main(argv=None):
+    parser = _build_parser(_command_token(sys.argv[1:] if argv is None else argv))
+    
+    args = parser.parse_args(argv)
     
     # Dispatch
-    commands = {
-        "status": cmd_status,
-        "precommit": cmd_precommit,
-        "doctor": cmd_doctor,
-        "baseline": cmd_baseline,
-        "index": cmd_index,
-    }
+    handler = COMMANDS.get(args.command)
+    if handler is None:
+        parser.print_help()
+        return 0
     
-    return commands[args.command](args)
+    # Resolve the project root once; handlers receive it absolute
+    args.root = os.path.abspath(args.root)
+    return handler(args)
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    raise SystemExit(main())